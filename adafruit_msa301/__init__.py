@@ -0,0 +1,1145 @@
+# SPDX-FileCopyrightText: 2019 Bryan Siepert for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=too-many-lines
+
+"""
+`MSA301`
+================================================================================
+
+CircuitPython library for the MSA301 Accelerometer
+
+
+* Author(s): Bryan Siepert
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* Adafruit `MSA301 Triple Axis Accelerometer
+  <https://www.adafruit.com/product/4344>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+* Adafruit's Bus Device library:
+  https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+* Adafruit's Register library:
+  https://github.com/adafruit/Adafruit_CircuitPython_Register
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MSA301.git"
+
+import time
+from array import array
+from collections import deque, namedtuple
+from micropython import const
+from adafruit_register.i2c_struct import Struct, ROUnaryStruct
+import adafruit_bus_device.i2c_device as i2cdevice
+
+_MSA301_I2CADDR_DEFAULT = const(0x26)
+_MSA311_I2CADDR_DEFAULT = const(0x62)
+
+_MSA301_REG_PARTID = const(0x01)
+_MSA301_REG_OUT_X_L = const(0x02)
+_MSA301_REG_OUT_X_H = const(0x03)
+_MSA301_REG_OUT_Y_L = const(0x04)
+_MSA301_REG_OUT_Y_H = const(0x05)
+_MSA301_REG_OUT_Z_L = const(0x06)
+_MSA301_REG_OUT_Z_H = const(0x07)
+_MSA301_REG_MOTIONINT = const(0x09)
+_MSA301_REG_DATAINT = const(0x0A)
+_MSA301_REG_RESRANGE = const(0x0F)
+_MSA301_REG_ODR = const(0x10)
+_MSA301_REG_POWERMODE = const(0x11)
+_MSA301_REG_INTSET0 = const(0x16)
+_MSA301_REG_INTSET1 = const(0x17)
+_MSA301_REG_INTMAP0 = const(0x19)
+_MSA301_REG_INTMAP1 = const(0x1A)
+_MSA301_REG_INTCONFIG = const(0x20)
+_MSA301_REG_INTLATCH = const(0x21)
+_MSA301_REG_FREEFALLDUR = const(0x22)
+_MSA301_REG_FREEFALLTH = const(0x23)
+_MSA301_REG_FREEFALLHY = const(0x24)
+_MSA301_REG_ACTIVEDUR = const(0x27)
+_MSA301_REG_ACTIVETH = const(0x28)
+_MSA301_REG_TAPDUR = const(0x2A)
+_MSA301_REG_TAPTH = const(0x2B)
+
+# the configuration registers mirrored in the shadow copy, read in one burst
+_MSA301_SHADOW_FIRST = const(_MSA301_REG_RESRANGE)
+_MSA301_SHADOW_LAST = const(_MSA301_REG_TAPTH)
+
+_STANDARD_GRAVITY = 9.806
+
+# (shift, m/s^2 per count) for the low nibble of RESRANGE, `resolution` << 2 | `range`.
+# The output registers are left-justified, using 14, 12, 10 or 8 of their 16 bits.
+_SCALE_TABLE = tuple(
+    (
+        2 + 2 * (index >> 2),
+        _STANDARD_GRAVITY * (2 << (index & 0b11)) / (1 << (13 - 2 * (index >> 2))),
+    )
+    for index in range(16)
+)
+
+# output data rate in Hz for each `DataRate` value, 0b1011 and up are 1000 Hz
+_DATA_RATE_HZ = (1, 1.95, 3.9, 7.81, 15.63, 31.25, 62.5, 125, 250, 500, 1000)
+
+
+def _sample_period_ns(data_rate):
+    # the time between samples at a `DataRate` value, in nanoseconds
+    return int(1_000_000_000 / _DATA_RATE_HZ[min(data_rate, 10)])
+
+
+SampleBlock = namedtuple("SampleBlock", ("samples", "range", "resolution", "data_rate"))
+"""The result of `MSA301.read_samples`: the raw ``samples``, a `memoryview` of
+exactly the values that were read, and the ``range``, ``resolution`` and
+``data_rate`` settings they were captured with."""
+
+
+EventRecord = namedtuple("EventRecord", ("timestamp_ns", "events"))
+"""An entry in the `MSA301` event queue: the `time.monotonic_ns` time the status was
+read, and the `Event` bits that were set."""
+
+_EVENT_QUEUE_SIZE = const(32)
+# every `Event` bit, MOTION_INT and the new data bit of DATA_INT
+_ALL_EVENTS = const(0x1FF)
+
+
+def _int16(buf, index):
+    # little-endian signed 16 bit value without going through struct
+    value = buf[index] | buf[index + 1] << 8
+    if value & 0x8000:
+        value -= 0x10000
+    return value
+
+
+class Mode:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the different modes that the MSA301 can
+    use. The values can be referenced like :attr:`Mode.NORMAL` or :attr:`Mode.SUSPEND`
+    Possible values are
+
+    - :attr:`Mode.NORMAL`
+    - :attr:`Mode.LOW_POWER`
+    - :attr:`Mode.SUSPEND`
+
+    """
+
+    # pylint: disable=invalid-name
+    NORMAL = 0b00
+    LOWPOWER = 0b01
+    SUSPEND = 0b010
+
+
+class DataRate:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the different
+    data rates that the MSA301 can
+    use. The values can be referenced like
+    :attr:`DataRate.RATE_1_HZ` or :attr:`DataRate.RATE_1000_HZ`
+    Possible values are
+
+    - :attr:`DataRate.RATE_1_HZ`
+    - :attr:`DataRate.RATE_1_95_HZ`
+    - :attr:`DataRate.RATE_3_9_HZ`
+    - :attr:`DataRate.RATE_7_81_HZ`
+    - :attr:`DataRate.RATE_15_63_HZ`
+    - :attr:`DataRate.RATE_31_25_HZ`
+    - :attr:`DataRate.RATE_62_5_HZ`
+    - :attr:`DataRate.RATE_125_HZ`
+    - :attr:`DataRate.RATE_250_HZ`
+    - :attr:`DataRate.RATE_500_HZ`
+    - :attr:`DataRate.RATE_1000_HZ`
+
+    """
+
+    RATE_1_HZ = 0b0000  # 1 Hz
+    RATE_1_95_HZ = 0b0001  # 1.95 Hz
+    RATE_3_9_HZ = 0b0010  # 3.9 Hz
+    RATE_7_81_HZ = 0b0011  # 7.81 Hz
+    RATE_15_63_HZ = 0b0100  # 15.63 Hz
+    RATE_31_25_HZ = 0b0101  # 31.25 Hz
+    RATE_62_5_HZ = 0b0110  # 62.5 Hz
+    RATE_125_HZ = 0b0111  # 125 Hz
+    RATE_250_HZ = 0b1000  # 250 Hz
+    RATE_500_HZ = 0b1001  # 500 Hz
+    RATE_1000_HZ = 0b1010  # 1000 Hz
+
+
+class BandWidth:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the different
+    bandwidths that the MSA301 can
+    use. The values can be referenced
+    like :attr:`BandWidth.WIDTH_1_HZ` or :attr:`BandWidth.RATE_500_HZ`
+    Possible values are
+
+    - :attr:`BandWidth.RATE_1_HZ`
+    - :attr:`BandWidth.RATE_1_95_HZ`
+    - :attr:`BandWidth.RATE_3_9_HZ`
+    - :attr:`BandWidth.RATE_7_81_HZ`
+    - :attr:`BandWidth.RATE_15_63_HZ`
+    - :attr:`BandWidth.RATE_31_25_HZ`
+    - :attr:`BandWidth.RATE_62_5_HZ`
+    - :attr:`BandWidth.RATE_125_HZ`
+    - :attr:`BandWidth.RATE_250_HZ`
+    - :attr:`BandWidth.RATE_500_HZ`
+    - :attr:`BandWidth.RATE_1000_HZ`
+
+    """
+
+    WIDTH_1_95_HZ = 0b0000  # 1.95 Hz
+    WIDTH_3_9_HZ = 0b0011  # 3.9 Hz
+    WIDTH_7_81_HZ = 0b0100  # 7.81 Hz
+    WIDTH_15_63_HZ = 0b0101  # 15.63 Hz
+    WIDTH_31_25_HZ = 0b0110  # 31.25 Hz
+    WIDTH_62_5_HZ = 0b0111  # 62.5 Hz
+    WIDTH_125_HZ = 0b1000  # 125 Hz
+    WIDTH_250_HZ = 0b1001  # 250 Hz
+    WIDTH_500_HZ = 0b1010  # 500 Hz
+
+
+class Range:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the different
+    acceleration measurement ranges that the
+    MSA301 can use. The values can be referenced like
+    :attr:`Range.RANGE_2_G` or :attr:`Range.RANGE_16_G`
+    Possible values are
+
+    - :attr:`Range.RANGE_2_G`
+    - :attr:`Range.RANGE_4_G`
+    - :attr:`Range.RANGE_8_G`
+    - :attr:`Range.RANGE_16_G`
+
+    """
+
+    RANGE_2_G = 0b00  # +/- 2g (default value)
+    RANGE_4_G = 0b01  # +/- 4g
+    RANGE_8_G = 0b10  # +/- 8g
+    RANGE_16_G = 0b11  # +/- 16g
+
+
+class Resolution:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the different
+    measurement ranges that the MSA301 can
+    use. The values can be referenced like
+    :attr:`Range.RANGE_2_G` or :attr:`Range.RANGE_16_G`
+    Possible values are
+
+    - :attr:`Resolution.RESOLUTION_14_BIT`
+    - :attr:`Resolution.RESOLUTION_12_BIT`
+    - :attr:`Resolution.RESOLUTION_10_BIT`
+    - :attr:`Resolution.RESOLUTION_8_BIT`
+
+    """
+
+    RESOLUTION_14_BIT = 0b00
+    RESOLUTION_12_BIT = 0b01
+    RESOLUTION_10_BIT = 0b10
+    RESOLUTION_8_BIT = 0b11
+
+
+class LatchMode:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing how long the MSA301 holds an interrupt once it
+    is triggered, for use with `MSA301.interrupt_latch`. The values can be referenced
+    like :attr:`LatchMode.LATCHED` or :attr:`LatchMode.TEMP_250_MS`
+    Possible values are
+
+    - :attr:`LatchMode.NON_LATCHED`: the interrupt status follows the event
+    - :attr:`LatchMode.LATCHED`: held until `MSA301.clear_interrupts` is called
+    - :attr:`LatchMode.TEMP_1_MS`
+    - :attr:`LatchMode.TEMP_2_MS`
+    - :attr:`LatchMode.TEMP_25_MS`
+    - :attr:`LatchMode.TEMP_50_MS`
+    - :attr:`LatchMode.TEMP_100_MS`
+    - :attr:`LatchMode.TEMP_250_MS`
+    - :attr:`LatchMode.TEMP_500_MS`
+    - :attr:`LatchMode.TEMP_1_S`
+    - :attr:`LatchMode.TEMP_2_S`
+    - :attr:`LatchMode.TEMP_4_S`
+    - :attr:`LatchMode.TEMP_8_S`
+
+    """
+
+    NON_LATCHED = 0b0000
+    TEMP_250_MS = 0b0001  # 250 millis
+    TEMP_500_MS = 0b0010  # 500 millis
+    TEMP_1_S = 0b0011  # 1 second
+    TEMP_2_S = 0b0100  # 2 seconds
+    TEMP_4_S = 0b0101  # 4 seconds
+    TEMP_8_S = 0b0110  # 8 seconds
+    LATCHED = 0b0111
+    TEMP_1_MS = 0b1010  # 1 millis
+    TEMP_2_MS = 0b1011  # 2 millis
+    TEMP_25_MS = 0b1100  # 25 millis
+    TEMP_50_MS = 0b1101  # 50 millis
+    TEMP_100_MS = 0b1110  # 100 millis
+
+
+class Event:  # pylint: disable=too-few-public-methods
+    """Bit flags for the events reported by `MSA301.events`. Test for them with
+    ``&``, like ``if msa.events() & Event.SINGLE_TAP:``. Possible values are
+
+    - :attr:`Event.FREEFALL`
+    - :attr:`Event.ACTIVE`
+    - :attr:`Event.DOUBLE_TAP`
+    - :attr:`Event.SINGLE_TAP`
+    - :attr:`Event.ORIENTATION`
+    - :attr:`Event.NEW_DATA`
+
+    """
+
+    # bits 0 - 7 are MOTION_INT (0x09), bit 8 is DATA_INT (0x0A)
+    FREEFALL = 1 << 0
+    ACTIVE = 1 << 2
+    DOUBLE_TAP = 1 << 4
+    SINGLE_TAP = 1 << 5
+    ORIENTATION = 1 << 6
+    NEW_DATA = 1 << 8
+
+
+class TapDuration:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """An enum-like class representing the options for the "double_tap_window" parameter of
+    `enable_tap_detection`"""
+
+    DURATION_50_MS = 0b000  # < 50 millis
+    DURATION_100_MS = 0b001  # < 100 millis
+    DURATION_150_MS = 0b010  # < 150 millis
+    DURATION_200_MS = 0b011  # < 200 millis
+    DURATION_250_MS = 0b100  # < 250 millis
+    DURATION_375_MS = 0b101  # < 375 millis
+    DURATION_500_MS = 0b110  # < 500 millis
+    DURATION_700_MS = 0b111  # < 50 millis700 millis
+
+
+_DEFAULT_CONFIG = {
+    "power_mode": Mode.NORMAL,
+    "data_rate": DataRate.RATE_500_HZ,
+    "bandwidth": BandWidth.WIDTH_250_HZ,
+    "range": Range.RANGE_4_G,
+    "resolution": Resolution.RESOLUTION_14_BIT,
+}
+
+
+class _CachedRWBits:
+    """
+    Multibit register field like :class:`adafruit_register.i2c_bits.RWBits`, but
+    backed by the driver's shadow copy of the configuration registers. Reads never
+    touch the bus and writes are a single register write instead of a
+    read-modify-write.
+
+    :param int num_bits: The number of bits in the field.
+    :param int register_address: The register address of the field
+    :param int lowest_bit: The lowest bits index within the byte at ``register_address``
+    """
+
+    def __init__(self, num_bits, register_address, lowest_bit):
+        self.bit_mask = ((1 << num_bits) - 1) << lowest_bit
+        self.address = register_address
+        self.lowest_bit = lowest_bit
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return (obj._shadow[self.address] & self.bit_mask) >> self.lowest_bit
+
+    def __set__(self, obj, value):
+        obj._write_register(self.address, self.merge(obj._shadow[self.address], value))
+
+    def merge(self, reg, value):
+        """Return the register value ``reg`` with this field set to ``value``"""
+        return reg & ~self.bit_mask | (value << self.lowest_bit) & self.bit_mask
+
+
+class _CachedRWBit(_CachedRWBits):
+    """
+    Single bit register field backed by the driver's shadow copy of the
+    configuration registers. Values are `bool`.
+
+    :param int register_address: The register address of the field
+    :param int bit: The bit index within the byte at ``register_address``
+    """
+
+    def __init__(self, register_address, bit):
+        super().__init__(1, register_address, bit)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return bool(obj._shadow[self.address] & self.bit_mask)
+
+    def __set__(self, obj, value):
+        super().__set__(obj, 1 if value else 0)
+
+
+class _Batch:
+    """Context manager returned by `MSA301.batch`"""
+
+    def __init__(self, sensor):
+        self._sensor = sensor
+        self._saved = None
+
+    def __enter__(self):
+        sensor = self._sensor
+        if sensor._batch_depth == 0:
+            sensor._batch_original = {}
+        sensor._batch_depth += 1
+        # the cached registers as they were when this level was entered, to roll
+        # back only its own changes if it raises inside an outer batch
+        self._saved = bytes(sensor._shadow)
+        return sensor
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        sensor = self._sensor
+        original = sensor._batch_original
+        if exc_type is not None:
+            for register in original:
+                sensor._shadow[register] = self._saved[register]
+        self._saved = None
+        sensor._batch_depth -= 1
+        if sensor._batch_depth:
+            return
+        sensor._batch_original = None
+        if exc_type is None:
+            sensor._flush_batch(original)
+
+
+class MSA301:  # pylint: disable=too-many-instance-attributes
+    """Driver for the MSA301 Accelerometer.
+
+    :param ~busio.I2C i2c_bus: The I2C bus the MSA is connected to.
+    :param dict config: Settings to apply instead of the defaults, by attribute name:
+        ``range``, ``resolution``, ``data_rate``, ``bandwidth`` and ``power_mode``.
+        The defaults are normal power mode, 500Hz data rate, 250Hz bandwidth,
+        +/-4g range and 14 bit resolution.
+    :param bool skip_probe: Set to `True` to skip checking for the sensor and its
+        part ID, for a faster start when the sensor is known to be there.
+
+
+    **Quickstart: Importing and using the device**
+
+        Here is an example of using the :class:`MSA301` class.
+        First you will need to import the libraries to use the sensor
+
+        .. code-block:: python
+
+            import board
+            import adafruit_msa301
+
+        Once this is done you can define your `board.I2C` object and define your sensor object
+
+        .. code-block:: python
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            msa = adafruit_msa301.MSA301(i2c)
+
+        Now you have access to the :attr:`acceleration` attribute
+
+        .. code-block:: python
+
+            acc_x, acc_y, acc_z = msa.acceleration
+
+    The configuration registers are mirrored in memory when the sensor is created
+    and kept up to date by every write made through the driver. If the sensor is
+    reset or reconfigured behind the driver's back, call :meth:`refresh_config`.
+
+    .. attribute:: stale_reads
+
+        The number of :meth:`read_new_acceleration_into` calls that found no new
+        sample
+
+    .. attribute:: missed_samples
+
+        The estimated number of samples :meth:`read_new_acceleration_into` did not
+        see because it was called too slowly
+
+    .. attribute:: interrupt_pin
+
+        An object with a ``wait(timeout)`` method that blocks until an edge on the
+        pin connected to INT1, used by :meth:`wait_for_event`. `None` by default.
+
+    .. attribute:: events_dropped
+
+        The number of `EventRecord` entries dropped from the full event queue of
+        :meth:`events`
+
+    """
+
+    _part_id = ROUnaryStruct(_MSA301_REG_PARTID, "<B")
+
+    def __init__(self, i2c_bus, *, config=None, skip_probe=False):
+        self._common_init(i2c_bus, _MSA301_I2CADDR_DEFAULT, config, skip_probe)
+
+    def _common_init(self, i2c_bus, i2c_addr, config, skip_probe):
+        """Shared __init__ implementation"""
+        self.i2c_device = i2cdevice.I2CDevice(i2c_bus, i2c_addr, probe=not skip_probe)
+        self._buffer = bytearray(2)
+        self._xyz_buffer = bytearray(6)
+        self._shadow = bytearray(_MSA301_SHADOW_LAST + 1)
+        # register values from before the open batch(), None outside of one
+        self._batch_original = None
+        self._batch_depth = 0
+        self._tap_count = 0
+        # latched motion events read from the sensor but not reported yet
+        self._pending_status = 0
+        self.interrupt_pin = None
+        self._event_queue = deque((), _EVENT_QUEUE_SIZE)
+        self.events_dropped = 0
+        self._shift, self._scale = _SCALE_TABLE[0]
+        # counters for read_new_acceleration_into()
+        self.stale_reads = 0
+        self.missed_samples = 0
+        self._last_sample_ns = None
+
+        if not skip_probe and self._part_id != 0x13:
+            raise AttributeError("Cannot find a MSA3x1")
+
+        settings = dict(_DEFAULT_CONFIG)
+        if config:
+            for name in config:
+                if name not in _DEFAULT_CONFIG:
+                    raise ValueError("Unknown config setting: %s" % name)
+            settings.update(config)
+
+        cls = type(self)
+        self.refresh_config()
+        self._apply(
+            [(getattr(cls, name), value) for name, value in settings.items()]
+            + [(MSA301._disable_x, 0), (MSA301._disable_y, 0), (MSA301._disable_z, 0)]
+        )
+
+    def refresh_config(self):
+        """Re-read the configuration registers from the sensor into the driver's
+        cached copy. Only needed if the sensor was reset or changed by something
+        other than this driver."""
+        self._buffer[0] = _MSA301_SHADOW_FIRST
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(
+                self._buffer,
+                self._shadow,
+                out_end=1,
+                in_start=_MSA301_SHADOW_FIRST,
+            )
+        self._update_scale()
+
+    def _write_register(self, register, value):
+        if self._batch_original is not None:
+            if register not in self._batch_original:
+                self._batch_original[register] = self._shadow[register]
+            self._shadow[register] = value
+            return
+        self._buffer[0] = register
+        self._buffer[1] = value
+        with self.i2c_device as i2c:
+            i2c.write(self._buffer)
+        self._shadow[register] = value
+        if register == _MSA301_REG_RESRANGE:
+            self._update_scale()
+
+    def _update_scale(self):
+        self._shift, self._scale = _SCALE_TABLE[
+            self._shadow[_MSA301_REG_RESRANGE] & 0x0F
+        ]
+
+    _disable_x = _CachedRWBit(_MSA301_REG_ODR, 7)
+    _disable_y = _CachedRWBit(_MSA301_REG_ODR, 6)
+    _disable_z = _CachedRWBit(_MSA301_REG_ODR, 5)
+
+    # _xyz_raw = ROBits(48, _MSA301_REG_OUT_X_L, 0, 6)
+    _xyz_raw = Struct(_MSA301_REG_OUT_X_L, "<hhh")
+
+    # tap INT enable and status
+    _single_tap_int_en = _CachedRWBit(_MSA301_REG_INTSET0, 5)
+    _double_tap_int_en = _CachedRWBit(_MSA301_REG_INTSET0, 4)
+    _new_data_int_en = _CachedRWBit(_MSA301_REG_INTSET1, 4)
+
+    # interrupt routing to the INT1 pin
+    int1_orientation = _CachedRWBit(_MSA301_REG_INTMAP0, 6)
+    """`True` to signal orientation interrupts on the INT1 pin"""
+    int1_single_tap = _CachedRWBit(_MSA301_REG_INTMAP0, 5)
+    """`True` to signal single tap interrupts on the INT1 pin"""
+    int1_double_tap = _CachedRWBit(_MSA301_REG_INTMAP0, 4)
+    """`True` to signal double tap interrupts on the INT1 pin"""
+    int1_active = _CachedRWBit(_MSA301_REG_INTMAP0, 2)
+    """`True` to signal active (any-motion) interrupts on the INT1 pin"""
+    int1_freefall = _CachedRWBit(_MSA301_REG_INTMAP0, 0)
+    """`True` to signal freefall interrupts on the INT1 pin"""
+    int1_new_data = _CachedRWBit(_MSA301_REG_INTMAP1, 0)
+    """`True` to signal new data interrupts on the INT1 pin"""
+    int1_active_high = _CachedRWBit(_MSA301_REG_INTCONFIG, 0)
+    """`True` if the INT1 pin goes high when an interrupt is triggered. It goes low by
+    default."""
+    int1_open_drain = _CachedRWBit(_MSA301_REG_INTCONFIG, 1)
+    """`True` to make the INT1 pin open drain instead of push-pull"""
+
+    def route_interrupts(
+        self,
+        *,
+        single_tap=None,
+        double_tap=None,
+        active=None,
+        freefall=None,
+        orientation=None,
+        new_data=None,
+    ):  # pylint: disable=too-many-arguments
+        """Choose which interrupts are signalled on the INT1 pin, in one batch of
+        writes. Interrupts left as `None` keep their current routing.
+
+        The interrupts still have to be enabled, for example with
+        :meth:`enable_tap_detection`. Combined with :attr:`interrupt_pin`, this lets
+        :meth:`wait_for_event` sleep until something happens instead of polling the
+        sensor.
+        """
+        cls = type(self)
+        self._apply(
+            (
+                (cls.int1_single_tap, single_tap),
+                (cls.int1_double_tap, double_tap),
+                (cls.int1_active, active),
+                (cls.int1_freefall, freefall),
+                (cls.int1_orientation, orientation),
+                (cls.int1_new_data, new_data),
+            )
+        )
+
+    def wait_for_event(self, timeout=None):
+        """Block until the INT1 pin signals an interrupt, and return `True`, or
+        return `False` if ``timeout`` seconds pass first. Waiting costs no I2C
+        traffic.
+
+        :attr:`interrupt_pin` must be set to an object with a ``wait(timeout)``
+        method that blocks until an edge on the pin connected to INT1, such as
+        `adafruit_msa301.interrupts.GPIOChipEdge` on Linux.
+
+        .. code-block:: python
+
+            from adafruit_msa301.interrupts import GPIOChipEdge
+
+            msa.interrupt_pin = GPIOChipEdge("/dev/gpiochip0", 17)
+            msa.enable_tap_detection()
+            msa.route_interrupts(single_tap=True)
+            while True:
+                if msa.wait_for_event(timeout=1.0) and msa.tapped:
+                    print("Tap!")
+
+        """
+        if self.interrupt_pin is None:
+            raise RuntimeError("interrupt_pin must be set to wait for events")
+        return self.interrupt_pin.wait(timeout)
+
+    def events(self):
+        """Read the motion and data interrupt status in one transaction and return the
+        triggered events as `Event` bits, or 0 if there are none.
+
+        Each non-zero result is also added to a queue of `EventRecord` with the time
+        it was read, for :meth:`drain_events`. The queue holds the 32 most recent
+        entries; older ones are dropped and counted in :attr:`events_dropped`. If
+        interrupts are latched (see :attr:`interrupt_latch`), each event is reported
+        once, also when :attr:`tapped` or :attr:`freefall` read the status in
+        between.
+        """
+        events = self._take_events(_ALL_EVENTS)
+        if events:
+            if len(self._event_queue) == _EVENT_QUEUE_SIZE:
+                self._event_queue.popleft()
+                self.events_dropped += 1
+            self._event_queue.append(EventRecord(time.monotonic_ns(), events))
+        return events
+
+    def drain_events(self):
+        """Remove and return the queued `EventRecord` entries, oldest first"""
+        drained = []
+        while self._event_queue:
+            drained.append(self._event_queue.popleft())
+        return drained
+
+    # interrupt latching
+    interrupt_latch = _CachedRWBits(4, _MSA301_REG_INTLATCH, 0)
+    """How long a triggered interrupt stays set, as a `LatchMode`. With
+    :attr:`LatchMode.LATCHED`, events such as taps are held until they are read, so
+    :attr:`tapped` can be polled rarely without missing any.
+
+    While latched, each event is reported once. Reading the status clears the latch
+    on the sensor, and the driver keeps the events that were not asked for until
+    something reports them: :attr:`tapped` only takes the tap bits, so a freefall
+    latched at the same time is still reported by :attr:`freefall` afterwards."""
+
+    def clear_interrupts(self):
+        """Clear all latched interrupts, including the ones read from the sensor but
+        not reported yet"""
+        self._pending_status = 0
+        self._clear_latch()
+
+    def _clear_latch(self):
+        # the reset bit clears itself, so it is never stored in the cached copy
+        self._buffer[0] = _MSA301_REG_INTLATCH
+        self._buffer[1] = self._shadow[_MSA301_REG_INTLATCH] | 0x80
+        with self.i2c_device as i2c:
+            i2c.write(self._buffer)
+
+    def _take_events(self, mask):
+        # Read the status and return its `Event` bits in mask. While latched, clear
+        # the latch and keep the other motion bits for whatever reports them later.
+        # DATA_INT is only read if NEW_DATA is asked for, and never needs clearing:
+        # reading the output registers does that.
+        self._buffer[0] = _MSA301_REG_MOTIONINT
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(
+                self._buffer,
+                self._buffer,
+                out_end=1,
+                in_end=2 if mask & Event.NEW_DATA else 1,
+            )
+        motion = self._buffer[0]
+        events = self._pending_status | motion
+        if mask & Event.NEW_DATA:
+            events |= (self._buffer[1] & 0x01) << 8
+        if motion and self._interrupts_latched:
+            self._clear_latch()
+            self._pending_status = events & ~mask & 0xFF
+        else:
+            self._pending_status &= ~mask
+        return events & mask
+
+    @property
+    def _interrupts_latched(self):
+        # 0b0111 and 0b1111 both mean latched
+        return self._shadow[_MSA301_REG_INTLATCH] & 0b0111 == LatchMode.LATCHED
+
+    # tap interrupt knobs
+    _tap_quiet = _CachedRWBit(_MSA301_REG_TAPDUR, 7)
+    _tap_shock = _CachedRWBit(_MSA301_REG_TAPDUR, 6)
+    _tap_duration = _CachedRWBits(3, _MSA301_REG_TAPDUR, 0)
+    _tap_threshold = _CachedRWBits(5, _MSA301_REG_TAPTH, 0)
+    reg_tapdur = ROUnaryStruct(_MSA301_REG_TAPDUR, "B")
+
+    # freefall INT enable and knobs
+    _freefall_int_en = _CachedRWBit(_MSA301_REG_INTSET1, 3)
+    _freefall_duration = _CachedRWBits(8, _MSA301_REG_FREEFALLDUR, 0)
+    _freefall_threshold = _CachedRWBits(8, _MSA301_REG_FREEFALLTH, 0)
+    _freefall_hysteresis = _CachedRWBits(2, _MSA301_REG_FREEFALLHY, 0)
+    _freefall_sum_mode = _CachedRWBit(_MSA301_REG_FREEFALLHY, 2)
+
+    # active (any-motion) INT enable and knobs
+    _active_int_en_x = _CachedRWBit(_MSA301_REG_INTSET0, 0)
+    _active_int_en_y = _CachedRWBit(_MSA301_REG_INTSET0, 1)
+    _active_int_en_z = _CachedRWBit(_MSA301_REG_INTSET0, 2)
+    _active_duration = _CachedRWBits(2, _MSA301_REG_ACTIVEDUR, 0)
+    _active_threshold = _CachedRWBits(8, _MSA301_REG_ACTIVETH, 0)
+
+    # general settings knobs
+    power_mode = _CachedRWBits(2, _MSA301_REG_POWERMODE, 6)
+    bandwidth = _CachedRWBits(4, _MSA301_REG_POWERMODE, 1)
+    data_rate = _CachedRWBits(4, _MSA301_REG_ODR, 0)
+    range = _CachedRWBits(2, _MSA301_REG_RESRANGE, 0)
+    resolution = _CachedRWBits(2, _MSA301_REG_RESRANGE, 2)
+
+    def configure(
+        self,
+        *,
+        range=None,
+        resolution=None,
+        data_rate=None,
+        bandwidth=None,
+        power_mode=None,
+    ):  # pylint: disable=redefined-builtin,too-many-arguments
+        """Change several settings at once, writing each affected register once.
+
+        ``range`` and ``resolution`` share a register, as do ``power_mode`` and
+        ``bandwidth``, so setting them one attribute at a time costs a write each.
+        Settings left as `None` are unchanged, and registers that end up with the
+        value they already had are not written at all.
+
+        .. code-block:: python
+
+            msa.configure(
+                range=adafruit_msa301.Range.RANGE_8_G,
+                resolution=adafruit_msa301.Resolution.RESOLUTION_14_BIT,
+                data_rate=adafruit_msa301.DataRate.RATE_1000_HZ,
+            )
+
+        """
+        cls = type(self)
+        self._apply(
+            (
+                (cls.range, range),
+                (cls.resolution, resolution),
+                (cls.data_rate, data_rate),
+                (cls.bandwidth, bandwidth),
+                (cls.power_mode, power_mode),
+            )
+        )
+
+    def _apply(self, fields):
+        # set each (field, value) pair not set to None, with one write per register
+        with self.batch():
+            for field, value in fields:
+                if value is not None:
+                    field.__set__(self, value)
+
+    def batch(self):
+        """Return a context manager that defers register writes until it exits.
+
+        Inside the ``with`` block, setting attributes such as :attr:`range`,
+        :attr:`data_rate` or the tap detection settings only updates the driver's
+        cached copy of the registers, so reading them back returns the new values.
+        When the block exits, every register that changed is written once, with
+        consecutive registers combined into a single transaction. Registers set back
+        to their original value are not written.
+
+        If the block raises an exception, the changes made inside it are discarded.
+        Batches can be nested, and only the outermost one writes, so an exception
+        in a nested batch that the outer block catches only discards the changes of
+        the nested one. If a write fails while the changes are written, the cached
+        values of the registers that were not written yet are restored.
+
+        .. code-block:: python
+
+            with msa.batch():
+                msa.range = adafruit_msa301.Range.RANGE_8_G
+                msa.resolution = adafruit_msa301.Resolution.RESOLUTION_12_BIT
+                msa.enable_tap_detection(tap_count=2)
+
+        """
+        return _Batch(self)
+
+    def _flush_batch(self, original):
+        changed = [
+            reg for reg in sorted(original) if original[reg] != self._shadow[reg]
+        ]
+        try:
+            while changed:
+                count = 1
+                while count < len(changed) and changed[count] == changed[0] + count:
+                    count += 1
+                first = changed[0]
+                burst = bytearray(count + 1)
+                burst[0] = first
+                burst[1:] = self._shadow[first : first + count]
+                with self.i2c_device as i2c:
+                    i2c.write(burst)
+                changed = changed[count:]
+        except BaseException:
+            # keep the cache in step with the sensor: the failed burst and the ones
+            # after it were not written
+            for register in changed:
+                self._shadow[register] = original[register]
+            raise
+        finally:
+            if _MSA301_REG_RESRANGE in original:
+                self._update_scale()
+
+    @property
+    def acceleration(self):
+        """The x, y, z acceleration values returned in a
+        3-tuple and are in :math:`m / s ^ 2`"""
+        # read the 6 bytes of acceleration data
+        x, y, z = self._xyz_raw
+
+        # shift down to the actual resolution and scale based on the range
+        shift = self._shift
+        scale = self._scale
+        return ((x >> shift) * scale, (y >> shift) * scale, (z >> shift) * scale)
+
+    def read_acceleration_into(self, buf):
+        """Read the latest x, y, z sample into a caller-owned buffer, and return
+        ``buf``.
+
+        What is stored depends on the type of ``buf``:
+
+        - a 6 byte `bytearray` or `memoryview` receives the raw output registers
+          (0x02 - 0x07), little-endian
+        - an ``array('h')`` of length 3 receives the raw signed counts, as they come
+          from the output registers (left-justified, not shifted)
+        - an ``array('f')`` or ``array('d')`` of length 3 receives the acceleration in
+          :math:`m / s ^ 2`, the same values as :attr:`acceleration`
+
+        The `bytearray`, `memoryview` and ``array('h')`` forms allocate nothing, so
+        reusing the same buffer for every sample keeps the garbage collector out of
+        tight sampling loops::
+
+            import array
+            sample = array.array("h", (0, 0, 0))
+            while True:
+                msa.read_acceleration_into(sample)
+
+        The ``array('f')`` form avoids the result tuple of :attr:`acceleration`, but
+        on CircuitPython and MicroPython builds that box floats, each of the three
+        scaled values is still a short-lived heap object.
+        """
+        typecode = getattr(buf, "typecode", None)
+        raw = buf if typecode is None else self._xyz_buffer
+
+        self._buffer[0] = _MSA301_REG_OUT_X_L
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._buffer, raw, out_end=1)
+
+        if typecode is not None:
+            self._store_sample(raw, buf, typecode)
+        return buf
+
+    def _store_sample(self, raw, buf, typecode):
+        shift = self._shift
+        scale = self._scale
+        for i in (0, 1, 2):
+            value = _int16(raw, 2 * i)
+            if typecode == "h":
+                buf[i] = value
+            else:
+                buf[i] = (value >> shift) * scale
+
+    @property
+    def data_ready(self):
+        """`True` if the sensor has a new sample that has not been read yet. Requires
+        the new data interrupt, which :meth:`read_new_acceleration_into` enables."""
+        self._buffer[0] = _MSA301_REG_DATAINT
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=1)
+        return bool(self._buffer[0] & 0x01)
+
+    def read_new_acceleration_into(self, buf):
+        """Like :meth:`read_acceleration_into`, but only reads the sample if the sensor
+        flagged it as new in the DATA_INT register, and returns `True` if it did.
+
+        Polls that find no new sample cost a single 1 byte read and are counted in
+        :attr:`stale_reads`. Fresh samples that arrive further apart than
+        :attr:`data_rate` allows are counted as :attr:`missed_samples`. Use
+        :meth:`reset_sample_counters` to start counting again.
+
+        .. code-block:: python
+
+            sample = array.array("f", (0, 0, 0))
+            while True:
+                if msa.read_new_acceleration_into(sample):
+                    print(sample)
+
+        """
+        if not self._new_data_int_en:
+            self._new_data_int_en = True
+
+        typecode = getattr(buf, "typecode", None)
+        raw = buf if typecode is None else self._xyz_buffer
+
+        self._buffer[0] = _MSA301_REG_DATAINT
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=1)
+            if not self._buffer[0] & 0x01:
+                self.stale_reads += 1
+                return False
+            self._buffer[0] = _MSA301_REG_OUT_X_L
+            i2c.write_then_readinto(self._buffer, raw, out_end=1)
+
+        now = time.monotonic_ns()
+        if self._last_sample_ns is not None:
+            period_ns = _sample_period_ns(self.data_rate)
+            # round to the nearest whole number of sample periods
+            skipped = (now - self._last_sample_ns + period_ns // 2) // period_ns - 1
+            if skipped > 0:
+                self.missed_samples += skipped
+        self._last_sample_ns = now
+
+        if typecode is not None:
+            self._store_sample(raw, buf, typecode)
+        return True
+
+    def reset_sample_counters(self):
+        """Reset :attr:`stale_reads` and :attr:`missed_samples` to zero"""
+        self.stale_reads = 0
+        self.missed_samples = 0
+        self._last_sample_ns = None
+
+    def read_samples(self, n, out=None):
+        """Read ``n`` consecutive x, y, z samples, paced by :attr:`data_rate`, and
+        return them as a `SampleBlock`.
+
+        The samples are stored as raw, left-justified counts in an ``array('h')``,
+        laid out as ``x0, y0, z0, x1, y1, z1, ...``. Pass a preallocated array as
+        ``out`` to reuse it between blocks. ``samples`` in the result is a
+        `memoryview` of the first ``3 * n`` values, so a larger ``out`` can be
+        passed without the stale values after them being mistaken for samples. The
+        I2C bus is locked once for the whole block, so other devices on the same bus
+        have to wait until it completes.
+
+        :param int n: The number of samples to read
+        :param array out: An ``array('h')`` with room for at least ``3 * n`` values.
+        """
+        if out is None:
+            out = array("h", bytes(6 * n))
+        elif len(out) < 3 * n:
+            raise ValueError("out must hold at least 3 * n values")
+
+        data_rate = self.data_rate
+        period_ns = _sample_period_ns(self.data_rate)
+        raw = self._xyz_buffer
+        self._buffer[0] = _MSA301_REG_OUT_X_L
+
+        with self.i2c_device as i2c:
+            deadline = time.monotonic_ns()
+            for i in range(0, 3 * n, 3):
+                delay = deadline - time.monotonic_ns()
+                if delay > 0:
+                    time.sleep(delay / 1_000_000_000)
+                deadline += period_ns
+                i2c.write_then_readinto(self._buffer, raw, out_end=1)
+                out[i] = _int16(raw, 0)
+                out[i + 1] = _int16(raw, 2)
+                out[i + 2] = _int16(raw, 4)
+
+        return SampleBlock(
+            memoryview(out)[: 3 * n], self.range, self.resolution, data_rate
+        )
+
+    def enable_tap_detection(
+        self,
+        *,
+        tap_count=1,
+        threshold=25,
+        long_initial_window=True,
+        long_quiet_window=True,
+        double_tap_window=TapDuration.DURATION_250_MS,
+    ):
+        """
+        Enables tap detection with configurable parameters.
+
+        :param int tap_count: 1 to detect only single taps, or 2 to detect only double taps.\
+        default is 1
+
+        :param int threshold: A threshold for the tap detection.\
+        The higher the value the less sensitive the detection. This changes based on the\
+        accelerometer range. Default is 25.
+
+        :param int long_initial_window: This sets the length of the window of time where a\
+        spike in acceleration must occour in before being followed by a quiet period.\
+        `True` (default) sets the value to 70ms, False to 50ms. Default is `True`
+
+        :param int long_quiet_window: The length of the "quiet" period after an acceleration\
+        spike where no more spikes can occur for a tap to be registered.\
+        `True` (default) sets the value to 30ms, False to 20ms. Default is `True`.
+
+        :param int double_tap_window: The length of time after an initial tap is registered\
+        in which a second tap must be detected to count as a double tap. Setting a lower\
+        value will require a faster double tap. The value must be a\
+        ``TapDuration``. Default is :attr:`TapDuration.DURATION_250_MS`.
+
+        If you wish to set them yourself rather than using the defaults,
+        you must use keyword arguments::
+
+            msa.enable_tap_detection(tap_count=2,
+                                     threshold=25,
+                                     double_tap_window=TapDuration.DURATION_700_MS)
+
+        """
+        if double_tap_window > 7 or double_tap_window < 0:
+            raise ValueError("double_tap_window must be a TapDuration")
+        if tap_count not in (1, 2):
+            raise ValueError("tap must be 1 for single tap, or 2 for double tap")
+
+        with self.batch():
+            self._tap_shock = not long_initial_window
+            self._tap_quiet = long_quiet_window
+            self._tap_threshold = threshold
+            if tap_count == 1:
+                self._single_tap_int_en = True
+            else:
+                self._tap_duration = double_tap_window
+                self._double_tap_int_en = True
+        self._tap_count = tap_count
+
+    def enable_freefall_detection(
+        self, *, enabled=True, threshold=48, duration=9, hysteresis=1, sum_mode=False
+    ):  # pylint: disable=too-many-arguments
+        """
+        Enables the on-chip freefall detection, which triggers when the acceleration
+        stays below a threshold for a while. Check for it with :attr:`freefall` or
+        :meth:`events`, or route it to INT1 with :meth:`route_interrupts`.
+
+        :param bool enabled: `False` to apply the settings but disable the freefall\
+        interrupt. Default is `True`.
+
+        :param int threshold: 0 to 255, in steps of 7.81mg. Default is 48 (375mg).
+
+        :param int duration: 0 to 255. The acceleration must stay below the\
+        threshold for (``duration`` + 1) * 2ms. Default is 9 (20ms).
+
+        :param int hysteresis: 0 to 3, in steps of 125mg. Default is 1 (125mg).
+
+        :param bool sum_mode: `False` (default) compares each axis with the\
+        threshold, `True` compares the sum of the absolute values of all three axes.
+        """
+        if not 0 <= threshold <= 255:
+            raise ValueError("threshold must be 0 to 255")
+        if not 0 <= duration <= 255:
+            raise ValueError("duration must be 0 to 255")
+        if not 0 <= hysteresis <= 3:
+            raise ValueError("hysteresis must be 0 to 3")
+        with self.batch():
+            self._freefall_threshold = threshold
+            self._freefall_duration = duration
+            self._freefall_hysteresis = hysteresis
+            self._freefall_sum_mode = sum_mode
+            self._freefall_int_en = enabled
+
+    @property
+    def freefall(self):
+        """`True` if a freefall was detected since the last check. Requires
+        :meth:`enable_freefall_detection`. If interrupts are latched (see\
+        :attr:`interrupt_latch`), other events are kept for :meth:`events` and\
+        :attr:`tapped`."""
+        if not self._freefall_int_en:
+            return False
+        return bool(self._take_events(Event.FREEFALL))
+
+    def enable_motion_detection(
+        self, *, enabled=True, threshold=20, duration=0, x=True, y=True, z=True
+    ):  # pylint: disable=too-many-arguments
+        """
+        Enables the active (any-motion) interrupt, which triggers while the change in
+        acceleration on an enabled axis exceeds a threshold. It is reported as
+        :attr:`Event.ACTIVE` by :meth:`events` and can be routed to INT1 with
+        :meth:`route_interrupts`.
+
+        :param bool enabled: `False` to apply the settings but disable the active\
+        interrupt on all axes. Default is `True`.
+
+        :param int threshold: 0 to 255. One step is 3.91mg at +/-2g, 7.81mg at +/-4g,\
+        15.625mg at +/-8g and 31.25mg at +/-16g. Default is 20.
+
+        :param int duration: 0 to 3, the number of consecutive samples, plus one,\
+        that must exceed the threshold. Default is 0.
+
+        :param bool x: Detect motion on the x axis. Default is `True`
+        :param bool y: Detect motion on the y axis. Default is `True`
+        :param bool z: Detect motion on the z axis. Default is `True`
+        """
+        if not 0 <= threshold <= 255:
+            raise ValueError("threshold must be 0 to 255")
+        if not 0 <= duration <= 3:
+            raise ValueError("duration must be 0 to 3")
+        with self.batch():
+            self._active_threshold = threshold
+            self._active_duration = duration
+            self._active_int_en_x = enabled and x
+            self._active_int_en_y = enabled and y
+            self._active_int_en_z = enabled and z
+
+    @property
+    def tapped(self):
+        """`True` if a single or double tap was detected, depending on the value of the\
+           ``tap_count`` argument passed to ``enable_tap_detection``. If interrupts are\
+           latched (see :attr:`interrupt_latch`), other events are kept for\
+           :meth:`events` and :attr:`freefall`."""
+        if self._tap_count == 0:
+            return False
+        if self._tap_count == 1:
+            return bool(self._take_events(Event.SINGLE_TAP))
+        return bool(self._take_events(Event.DOUBLE_TAP))
+
+
+class MSA311(MSA301):
+    """
+    Overriden __init__ method with a diffrent I2C address to support MSA311
+    """
+
+    def __init__(self, i2c_bus, *, config=None, skip_probe=False):
+        self._common_init(i2c_bus, _MSA311_I2CADDR_DEFAULT, config, skip_probe)
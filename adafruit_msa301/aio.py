@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.aio`
+================================================================================
+
+asyncio front-end for the MSA301 and MSA311 drivers, for hosts running CPython.
+
+The driver's blocking I2C transactions run on a single worker thread per sensor,
+so the event loop keeps running while the bus is busy, and requests to one sensor
+never overlap. Pacing uses the event loop's clock rather than `time.sleep`.
+
+.. code-block:: python
+
+    import asyncio
+    import board
+    import adafruit_msa301
+    from adafruit_msa301.aio import AsyncMSA301
+
+    async def main():
+        i2c = board.I2C()
+        async with AsyncMSA301(adafruit_msa301.MSA301(i2c)) as msa:
+            async for x, y, z in msa.stream(100):
+                print(x, y, z)
+
+    asyncio.run(main())
+
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from adafruit_msa301 import _sample_period_ns
+
+
+class AsyncMSA301:
+    """Awaitable wrapper around a `adafruit_msa301.MSA301` or
+    `adafruit_msa301.MSA311`.
+
+    :param sensor: The driver instance to wrap
+    :param executor: A `concurrent.futures.Executor` to run bus transactions on.
+        By default a single thread is created for this sensor and shut down by
+        :meth:`close`. A shared executor must not run two calls for the same sensor
+        at once.
+    """
+
+    def __init__(self, sensor, *, executor=None):
+        self.sensor = sensor
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+        self._executor = executor
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def read(self):
+        """Read one x, y, z sample in :math:`m / s ^ 2`, like
+        `adafruit_msa301.MSA301.acceleration`"""
+        return await self._run(getattr, self.sensor, "acceleration")
+
+    async def read_into(self, buf):
+        """Read one sample into ``buf``, see
+        `adafruit_msa301.MSA301.read_acceleration_into`"""
+        return await self._run(self.sensor.read_acceleration_into, buf)
+
+    async def read_samples(self, n, out=None):
+        """Read a block of ``n`` samples, see `adafruit_msa301.MSA301.read_samples`"""
+        return await self._run(self.sensor.read_samples, n, out)
+
+    async def stream(self, rate=None, count=None):
+        """Yield samples in :math:`m / s ^ 2` at ``rate`` Hz, for use with
+        ``async for``.
+
+        :param float rate: The number of samples per second. Defaults to the sensor's
+            `adafruit_msa301.MSA301.data_rate`.
+        :param int count: Stop after this many samples. By default the stream runs
+            until the consumer stops iterating.
+
+        If a read or the consumer falls behind schedule, the stream skips ahead
+        rather than issuing a burst of late reads.
+        """
+        if rate is None:
+            period = _sample_period_ns(self.sensor.data_rate) / 1_000_000_000
+        else:
+            period = 1 / rate
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        produced = 0
+        while count is None or produced < count:
+            yield await self.read()
+            produced += 1
+            deadline += period
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                deadline = loop.time()
+
+    async def wait_for_tap(self, *, poll_interval=0.01, timeout=None):
+        """Wait until `adafruit_msa301.MSA301.tapped` reports a tap. Tap detection
+        must already be enabled with `adafruit_msa301.MSA301.enable_tap_detection`.
+
+        :param float poll_interval: Seconds between checks of the tap status
+        :param float timeout: Give up after this many seconds and return `False`.
+            By default, wait forever.
+        :return: `True` once a tap was detected
+        """
+
+        async def poll():
+            while not await self._run(getattr, self.sensor, "tapped"):
+                await asyncio.sleep(poll_interval)
+            return True
+
+        try:
+            return await asyncio.wait_for(poll(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self):
+        """Shut down the worker thread, if this wrapper created it"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.analysis`
+================================================================================
+
+Parallel offline analysis of captures recorded with `adafruit_msa301.capture`, for
+hosts running CPython with NumPy.
+
+:func:`analyze` splits capture files into chunks on frame boundaries, and calls a
+reducer on each chunk in a `concurrent.futures.ProcessPoolExecutor`. Workers are
+only sent the path and frame range of their chunk, and memory-map the file
+themselves, so no sample data is copied between processes. Chunks of compressed
+captures are aligned to their blocks and decoded in the workers.
+
+.. code-block:: python
+
+    import numpy as np
+    from adafruit_msa301.analysis import analyze
+
+    # reducers must be picklable: define them at module level
+    def peak(frames, header):
+        return np.abs(frames["xyz"]).max(axis=0)
+
+    if __name__ == "__main__":
+        peaks = analyze(["monday.msa", "tuesday.msa"], peak)
+        print(np.max(peaks, axis=0))
+
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+
+from adafruit_msa301.capture import CaptureReader
+
+Chunk = namedtuple("Chunk", ("path", "start", "stop"))
+"""A range of frames in a capture file, from ``start`` up to but excluding
+``stop``"""
+
+
+def split(path, chunk_frames=1_000_000):
+    """Split a capture file into chunks of about ``chunk_frames`` frames. Chunks of
+    compressed captures start on block boundaries, so that each chunk only decodes
+    its own blocks, and can be slightly larger.
+
+    :param str path: The capture file
+    :param int chunk_frames: The number of frames in a chunk
+    :return: A `list` of `Chunk`
+    """
+    if chunk_frames < 1:
+        raise ValueError("chunk_frames must be at least 1")
+    with CaptureReader(path) as capture:
+        frame_count = capture.frame_count
+        boundaries = [block[0] for block in capture.blocks]
+    if not boundaries:
+        boundaries = range(0, frame_count, chunk_frames)
+    starts = []
+    for boundary in boundaries:
+        if not starts or boundary - starts[-1] >= chunk_frames:
+            starts.append(boundary)
+    return [
+        Chunk(path, start, stop)
+        for start, stop in zip(starts, starts[1:] + [frame_count])
+    ]
+
+
+def run_chunk(chunk, reducer):
+    """Call ``reducer`` on one chunk, in the current process. This is what
+    :func:`analyze` runs in each worker.
+
+    :param Chunk chunk: The frames to reduce
+    :param reducer: Called with the frames of the chunk, as returned by
+        `adafruit_msa301.capture.CaptureReader.to_numpy`, and the
+        `adafruit_msa301.capture.CaptureHeader` of the file
+    :return: The result of ``reducer``
+    """
+    capture = CaptureReader(chunk.path)
+    frames = capture.to_numpy(chunk.start, chunk.stop)
+    result = reducer(frames, capture.header)
+    del frames
+    try:
+        capture.close()
+    except BufferError:
+        # the result still references the mapping, which is unmapped once it is freed
+        pass
+    return result
+
+
+def analyze(
+    paths, reducer, *, combine=None, chunk_frames=1_000_000, executor=None
+):  # pylint: disable=too-many-arguments
+    """Reduce capture files chunk by chunk, in parallel.
+
+    :param paths: The path of a capture file, or a sequence of them
+    :param reducer: A picklable function called with the frames of each chunk, as
+        returned by `adafruit_msa301.capture.CaptureReader.to_numpy`, and the
+        `adafruit_msa301.capture.CaptureHeader` of its file
+    :param combine: An optional function of two results, used to merge the results
+        of all the chunks, in order, into one
+    :param int chunk_frames: The number of frames in a chunk, see :func:`split`. Smaller
+        chunks balance the load better, larger ones have less overhead.
+    :param executor: The `concurrent.futures.Executor` to run chunks on. By default
+        a new `concurrent.futures.ProcessPoolExecutor` with one worker per core is
+        created and shut down again.
+    :return: The results of ``reducer`` in file and frame order, or their
+        combination if ``combine`` is given
+    """
+    if isinstance(paths, str):
+        paths = (paths,)
+    chunks = [chunk for path in paths for chunk in split(path, chunk_frames)]
+
+    if executor is None:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(run_chunk, chunks, repeat(reducer)))
+    else:
+        results = list(executor.map(run_chunk, chunks, repeat(reducer)))
+
+    if combine is None:
+        return results
+    return reduce(combine, results)
@@ -0,0 +1,763 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.capture`
+================================================================================
+
+A compact binary log format for MSA301/MSA311 samples, for hosts running CPython.
+
+A capture file is a fixed size header recording the part and its range,
+resolution, data rate and bandwidth, followed by fixed width frames of raw
+little-endian ``int16`` x, y, z counts, each optionally preceded by an ``int64``
+`time.monotonic_ns` timestamp. `CaptureWriter` appends blocks from
+`adafruit_msa301.MSA301.read_samples`. `CaptureReader` memory-maps the file and
+returns `memoryview` or NumPy views of the frames without copying, so large logs
+open instantly.
+
+When the writer is closed it appends a sparse time index, mapping the timestamp of
+every ``index_interval``-th frame to its position, so `CaptureReader.slice` finds a
+time range in a multi-hour capture without scanning it. Captures recorded without
+per-frame timestamps are indexed with times estimated when each block was written,
+and interpolated between index entries.
+
+Captures can optionally be compressed for long-term storage. Frames are then stored
+in independently decodable blocks of per-axis deltas of the values at the recorded
+resolution, as zig-zag varints, so a still sensor costs about three bytes per frame
+instead of six. Blocks are encoded and decoded with vectorized NumPy code when
+NumPy is installed, and with pure Python otherwise. Compressed frames are decoded
+on access, so `CaptureReader.to_numpy` returns a copy rather than a view.
+
+.. code-block:: python
+
+    from adafruit_msa301.capture import CaptureReader, CaptureWriter
+
+    with CaptureWriter.for_sensor("vibration.msa", msa) as log:
+        for _ in range(100):
+            log.write(msa.read_samples(1000))
+
+    with CaptureReader("vibration.msa") as log:
+        xyz = log.to_numpy()["xyz"]  # int16 array of shape (N, 3)
+        start, stop = log.frame_range(t0, t0 + 60_000_000_000)
+        minute = log.to_numpy(start, stop)
+
+"""
+
+import mmap
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from adafruit_msa301 import _SCALE_TABLE, MSA311, _sample_period_ns
+
+MAGIC = b"MSA3CAP\x00"
+INDEX_MAGIC = b"MSA3IDX\x00"
+VERSION = 1
+
+PART_MSA301 = 0x01
+PART_MSA311 = 0x02
+
+FLAG_TIMESTAMPS = 0x01
+"""Frames start with an ``int64`` timestamp in nanoseconds"""
+FLAG_COMPRESSED = 0x02
+"""Frames are stored in delta and zig-zag varint encoded blocks"""
+
+# magic, version, header size, part, range, resolution, data rate, bandwidth, flags,
+# frame size, padded to 32 bytes
+_HEADER = struct.Struct("<8sHHBBBBBBH12x")
+_XYZ = struct.Struct("<hhh")
+_TIMESTAMPED_XYZ = struct.Struct("<qhhh")
+_TIMESTAMP = struct.Struct("<q")
+# timestamp, frame number, byte offset of the frame
+_INDEX_ENTRY = struct.Struct("<qQQ")
+# index offset, entry count, magic, at the very end of the file
+_TRAILER = struct.Struct("<QQ8s")
+# frames, payload length, timestamp of the first frame, shift of the values, in
+# front of each compressed block
+_BLOCK = struct.Struct("<IIqB3x")
+
+
+class CaptureHeader:
+    """The settings a capture was recorded with.
+
+    :param int part: `PART_MSA301` or `PART_MSA311`
+    :param int accel_range: The `adafruit_msa301.Range` of the samples
+    :param int resolution: The `adafruit_msa301.Resolution` of the samples
+    :param int data_rate: The `adafruit_msa301.DataRate` of the samples
+    :param int bandwidth: The `adafruit_msa301.BandWidth` of the samples
+    :param int flags: A combination of the ``FLAG_`` values
+    """
+
+    def __init__(
+        self, *, part, accel_range, resolution, data_rate, bandwidth, flags=0
+    ):  # pylint: disable=too-many-arguments
+        self.part = part
+        self.range = accel_range
+        self.resolution = resolution
+        self.data_rate = data_rate
+        self.bandwidth = bandwidth
+        self.flags = flags
+
+    @property
+    def timestamps(self):
+        """`True` if every frame carries a timestamp"""
+        return bool(self.flags & FLAG_TIMESTAMPS)
+
+    @property
+    def compressed(self):
+        """`True` if frames are stored in compressed blocks"""
+        return bool(self.flags & FLAG_COMPRESSED)
+
+    @property
+    def frame_size(self):
+        """The size of one frame in bytes, or 0 for compressed captures"""
+        if self.compressed:
+            return 0
+        return _TIMESTAMPED_XYZ.size if self.timestamps else _XYZ.size
+
+    @property
+    def shift(self):
+        """The number of unused low bits in the raw, left-justified counts"""
+        return _SCALE_TABLE[self.resolution << 2][0]
+
+    @property
+    def size(self):
+        """The size of the header in bytes"""
+        return _HEADER.size
+
+    @property
+    def sample_period_ns(self):
+        """The nominal time between frames at the recorded data rate, in
+        nanoseconds"""
+        return _sample_period_ns(self.data_rate)
+
+    @property
+    def config(self):
+        """The recorded settings as a `dict`, usable as the ``config`` argument of
+        `adafruit_msa301.MSA301`"""
+        return {
+            "range": self.range,
+            "resolution": self.resolution,
+            "data_rate": self.data_rate,
+            "bandwidth": self.bandwidth,
+        }
+
+    def pack(self):
+        """The header as `bytes`"""
+        return _HEADER.pack(
+            MAGIC,
+            VERSION,
+            _HEADER.size,
+            self.part,
+            self.range,
+            self.resolution,
+            self.data_rate,
+            self.bandwidth,
+            self.flags,
+            self.frame_size,
+        )
+
+    @classmethod
+    def unpack(cls, data):
+        """Parse a header from the start of ``data``"""
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a MSA3x1 capture: file is too short")
+        fields = _HEADER.unpack_from(data)
+        if fields[0] != MAGIC:
+            raise ValueError("Not a MSA3x1 capture: bad magic")
+        if fields[1] != VERSION:
+            raise ValueError("Unsupported capture version %d" % fields[1])
+        header = cls(
+            part=fields[3],
+            accel_range=fields[4],
+            resolution=fields[5],
+            data_rate=fields[6],
+            bandwidth=fields[7],
+            flags=fields[8],
+        )
+        if fields[2] != _HEADER.size or fields[9] != header.frame_size:
+            raise ValueError("Corrupt capture header")
+        return header
+
+
+def _block_shift(samples, max_shift):
+    # the largest shift, up to the one of the resolution, that loses no set bits
+    if np is not None:
+        bits = int(np.bitwise_or.reduce(np.asarray(samples, dtype=np.int64) & 0xFFFF))
+    else:
+        bits = 0
+        for value in samples:
+            bits |= value & 0xFFFF
+    if not bits:
+        return max_shift
+    return min(max_shift, (bits & -bits).bit_length() - 1)
+
+
+def _encode_varints_numpy(values):
+    zigzag = ((values << 1) ^ (values >> 63)).view(np.uint64)
+    lengths = np.ones(len(zigzag), dtype=np.int64)
+    for i in range(1, 10):
+        lengths += zigzag >= np.uint64(1 << (7 * i))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    out = np.empty(int(ends[-1]), dtype=np.uint8)
+    # one pass per byte position, over the values that are at least that long
+    for i in range(int(lengths.max())):
+        mask = lengths > i
+        data = (zigzag[mask] >> np.uint64(7 * i)) & np.uint64(0x7F)
+        data |= (lengths[mask] > i + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + i] = data
+    return out.tobytes()
+
+
+def _decode_varints_numpy(payload, count):
+    data = np.frombuffer(payload, dtype=np.uint8)
+    ends = np.flatnonzero(data < 0x80)
+    if len(ends) != count or (count and ends[-1] != len(data) - 1):
+        raise ValueError("Corrupt capture block")
+    starts = np.zeros(count, dtype=np.int64)
+    starts[1:] = ends[:-1] + 1
+    owners = np.repeat(np.arange(count), ends - starts + 1)
+    positions = (np.arange(len(data)) - starts[owners]).astype(np.uint64)
+    parts = (data & 0x7F).astype(np.uint64) << (np.uint64(7) * positions)
+    zigzag = np.add.reduceat(parts, starts)
+    return (zigzag >> np.uint64(1)).astype(np.int64) ^ -(zigzag & np.uint64(1)).astype(
+        np.int64
+    )
+
+
+def _encode_varints_python(values):
+    out = bytearray()
+    for value in values:
+        value = (value << 1) ^ (value >> 63)
+        while value > 0x7F:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_varints_python(payload, count):
+    values = []
+    value = position = 0
+    for data in payload:
+        value |= (data & 0x7F) << position
+        if data & 0x80:
+            position += 7
+        else:
+            values.append((value >> 1) ^ -(value & 1))
+            value = position = 0
+    if len(values) != count or position:
+        raise ValueError("Corrupt capture block")
+    return values
+
+
+def _encode_block(samples, timestamps, period, shift):
+    # per frame: the timestamp delta less one period, if any, then the x, y and z
+    # deltas, all from zero at the start of the block
+    if np is not None:
+        xyz = np.asarray(samples, dtype=np.int64).reshape(-1, 3) >> shift
+        deltas = np.diff(xyz, axis=0, prepend=0)
+        if timestamps is not None:
+            times = np.asarray(timestamps, dtype=np.int64)
+            time_deltas = np.diff(times, prepend=times[0])
+            time_deltas[1:] -= period
+            deltas = np.hstack((time_deltas[:, None], deltas))
+        return _encode_varints_numpy(deltas.ravel())
+
+    deltas = []
+    previous = [0, 0, 0]
+    for i in range(len(samples) // 3):
+        if timestamps is not None:
+            delta = timestamps[i] - timestamps[i - 1] - period if i else 0
+            deltas.append(delta)
+        for axis in range(3):
+            value = samples[3 * i + axis] >> shift
+            deltas.append(value - previous[axis])
+            previous[axis] = value
+    return _encode_varints_python(deltas)
+
+
+def _decode_block(payload, frames, first_timestamp, shift, header):
+    # returns the timestamps, or None, and the flat x, y, z counts of the block
+    columns = 4 if header.timestamps else 3
+    if np is not None:
+        deltas = _decode_varints_numpy(payload, frames * columns)
+        values = np.cumsum(deltas.reshape(frames, columns), axis=0)
+        xyz = (values[:, -3:] << shift).astype(np.int16).ravel()
+        if not header.timestamps:
+            return None, xyz
+        steps = np.arange(frames, dtype=np.int64) * header.sample_period_ns
+        return first_timestamp + values[:, 0] + steps, xyz
+
+    deltas = _decode_varints_python(payload, frames * columns)
+    timestamps = array("q") if header.timestamps else None
+    xyz = array("h")
+    running = [0] * columns
+    for i in range(frames):
+        for column in range(columns):
+            running[column] += deltas[i * columns + column]
+        if header.timestamps:
+            timestamps.append(
+                first_timestamp + running[0] + i * header.sample_period_ns
+            )
+        xyz.extend(value << shift for value in running[-3:])
+    return timestamps, xyz
+
+
+def _open(file, mode):
+    if hasattr(file, "write" if "w" in mode else "read"):
+        return file, False
+    return open(file, mode), True  # pylint: disable=consider-using-with
+
+
+class CaptureWriter:  # pylint: disable=too-many-instance-attributes
+    """Append raw samples to a capture file.
+
+    :param file: A path, or a binary file object open for writing
+    :param CaptureHeader header: The settings of the samples that will be written
+    :param int index_interval: The number of frames between time index entries.
+        Compressed captures have an entry for every block instead.
+    :param int block_frames: The number of frames in each block of a compressed
+        capture. Larger blocks compress slightly better, smaller ones are faster to
+        seek in.
+    """
+
+    def __init__(self, file, header, *, index_interval=1024, block_frames=1024):
+        self.header = header
+        self.index_interval = index_interval
+        self.block_frames = block_frames
+        self.frame_count = 0
+        self._offset = header.size
+        self._index = []
+        self._last_entry = None
+        # the timestamp of the last frame written, measured or estimated
+        self._last_timestamp = None
+        # frames waiting to fill a compressed block
+        self._pending = array("h")
+        self._pending_timestamps = []
+        self._file, self._owns_file = _open(file, "wb")
+        self._file.write(header.pack())
+
+    @classmethod
+    def for_sensor(
+        cls,
+        file,
+        sensor,
+        *,
+        timestamps=False,
+        compressed=False,
+        index_interval=1024,
+        block_frames=1024,
+    ):  # pylint: disable=too-many-arguments
+        """Create a writer for samples from ``sensor``, using its current settings.
+
+        :param file: A path, or a binary file object open for writing
+        :param sensor: The `adafruit_msa301.MSA301` or `adafruit_msa301.MSA311`
+        :param bool timestamps: `True` to store a timestamp with every frame
+        :param bool compressed: `True` to store frames in compressed blocks
+        :param int index_interval: The number of frames between time index entries
+        :param int block_frames: The number of frames in each compressed block
+        """
+        header = CaptureHeader(
+            part=PART_MSA311 if isinstance(sensor, MSA311) else PART_MSA301,
+            accel_range=sensor.range,
+            resolution=sensor.resolution,
+            data_rate=sensor.data_rate,
+            bandwidth=sensor.bandwidth,
+            flags=(FLAG_TIMESTAMPS if timestamps else 0)
+            | (FLAG_COMPRESSED if compressed else 0),
+        )
+        return cls(
+            file, header, index_interval=index_interval, block_frames=block_frames
+        )
+
+    def write(self, samples, timestamps=None):
+        """Append frames to the capture.
+
+        :param samples: Raw ``x0, y0, z0, x1, ...`` counts as an ``array('h')``, or a
+            `adafruit_msa301.SampleBlock`, whose settings must match the header
+        :param timestamps: One timestamp per frame, required if the capture stores
+            timestamps. Otherwise the last frame is assumed to have been read just
+            now, at the recorded data rate, for the time index. Frames written faster
+            than that are assumed to follow the previous ones without a gap.
+        """
+        if hasattr(samples, "samples"):
+            header = self.header
+            if (samples.range, samples.resolution, samples.data_rate) != (
+                header.range,
+                header.resolution,
+                header.data_rate,
+            ):
+                raise ValueError("SampleBlock settings do not match the capture")
+            samples = samples.samples
+        if getattr(samples, "typecode", getattr(samples, "format", None)) != "h":
+            samples = array("h", samples)
+        count = len(samples) // 3
+        if not count:
+            return
+        if self.header.timestamps and (timestamps is None or len(timestamps) < count):
+            raise ValueError("a timestamp is needed for every frame")
+        if not self.header.timestamps:
+            period = self.header.sample_period_ns
+            start = time.monotonic_ns() - (count - 1) * period
+            if self._last_timestamp is not None:
+                # frames written faster than real time must not go back in time
+                start = max(start, self._last_timestamp + period)
+            timestamps = range(start, start + count * period, period)
+        self._last_timestamp = timestamps[count - 1]
+
+        if self.header.compressed:
+            self._pending.extend(samples[: 3 * count])
+            self._pending_timestamps.extend(timestamps[:count])
+            self.frame_count += count
+            while len(self._pending_timestamps) >= self.block_frames:
+                self._write_block(self.block_frames)
+            return
+
+        self._index_frames(count, timestamps)
+        if not self.header.timestamps:
+            self._file.write(memoryview(samples)[: 3 * count])
+        else:
+            frames = bytearray(count * _TIMESTAMPED_XYZ.size)
+            for i in range(count):
+                _TIMESTAMPED_XYZ.pack_into(
+                    frames,
+                    i * _TIMESTAMPED_XYZ.size,
+                    timestamps[i],
+                    samples[3 * i],
+                    samples[3 * i + 1],
+                    samples[3 * i + 2],
+                )
+            self._file.write(frames)
+        self.frame_count += count
+        self._offset += count * self.header.frame_size
+
+    def _index_frames(self, count, timestamps):
+        first = self.frame_count
+        frame_size = self.header.frame_size
+        # the first frame of the block on an index_interval boundary
+        frame = -(-first // self.index_interval) * self.index_interval
+        while frame < first + count:
+            offset = self._offset + (frame - first) * frame_size
+            self._index.append((timestamps[frame - first], frame, offset))
+            frame += self.index_interval
+        self._last_entry = (
+            timestamps[count - 1],
+            first + count - 1,
+            self._offset + (count - 1) * frame_size,
+        )
+
+    def _write_block(self, count):
+        samples = self._pending[: 3 * count]
+        timestamps = self._pending_timestamps[:count]
+        shift = _block_shift(samples, self.header.shift)
+        payload = _encode_block(
+            samples,
+            timestamps if self.header.timestamps else None,
+            self.header.sample_period_ns,
+            shift,
+        )
+        first = self.frame_count - len(self._pending_timestamps)
+        self._index.append((timestamps[0], first, self._offset))
+        self._last_entry = (timestamps[-1], first + count - 1, self._offset)
+        self._file.write(_BLOCK.pack(count, len(payload), timestamps[0], shift))
+        self._file.write(payload)
+        self._offset += _BLOCK.size + len(payload)
+        del self._pending[: 3 * count]
+        del self._pending_timestamps[:count]
+
+    def flush(self):
+        """Flush buffered frames to the file. In compressed captures, frames waiting
+        for a full block are written as a shorter block."""
+        if self._pending_timestamps:
+            self._write_block(len(self._pending_timestamps))
+        self._file.flush()
+
+    def close(self):
+        """Finish the capture by appending the time index, and close the file if the
+        writer opened it"""
+        if self._file is None:
+            return
+        self.flush()
+        index = self._index
+        # always index the last frame, so times can be interpolated up to the end
+        if self._last_entry is not None and index[-1] != self._last_entry:
+            index.append(self._last_entry)
+        entries = bytearray(len(index) * _INDEX_ENTRY.size)
+        for i, entry in enumerate(index):
+            _INDEX_ENTRY.pack_into(entries, i * _INDEX_ENTRY.size, *entry)
+        self._file.write(entries)
+        self._file.write(_TRAILER.pack(self._offset, len(index), INDEX_MAGIC))
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CaptureReader:
+    """Memory-map a capture file for reading. Frames are not read or copied until
+    they are accessed. Captures that were not closed cleanly can still be read, but
+    have no time index.
+
+    The frames of compressed captures are decoded a block at a time, on access.
+    :attr:`frames`, :attr:`samples` and :meth:`slice` are not available for them:
+    use :meth:`frame_range` and :meth:`to_numpy` instead.
+
+    :param str path: The capture file to open
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.header = CaptureHeader.unpack(self._mmap)
+        self.index_offset, self.index = self._read_index()
+        """The time index, a `list` of ``(timestamp_ns, frame, byte_offset)``
+        entries in frame order"""
+        self._index_times = [entry[0] for entry in self.index]
+        end = len(self._mmap) if self.index_offset is None else self.index_offset
+        self.blocks = []
+        """The ``(first_frame, byte_offset)`` of each block of a compressed
+        capture"""
+        self._cached_block = None
+        self._cached_frames = None
+        if self.header.compressed:
+            self.blocks, self.frame_count = self._read_blocks(end)
+        else:
+            # a partially written last frame is ignored
+            self.frame_count = (end - self.header.size) // self.header.frame_size
+        self._block_starts = [block[0] for block in self.blocks]
+
+    def _read_index(self):
+        size = len(self._mmap)
+        if size < self.header.size + _TRAILER.size:
+            return None, []
+        offset, count, magic = _TRAILER.unpack_from(self._mmap, size - _TRAILER.size)
+        if (
+            magic != INDEX_MAGIC
+            or offset < self.header.size
+            or offset + count * _INDEX_ENTRY.size + _TRAILER.size != size
+        ):
+            return None, []
+        return offset, [
+            _INDEX_ENTRY.unpack_from(self._mmap, offset + i * _INDEX_ENTRY.size)
+            for i in range(count)
+        ]
+
+    def _read_blocks(self, end):
+        if self.index:
+            # every block is indexed, the last entry may be inside the last block
+            blocks = []
+            for _, frame, offset in self.index:
+                if not blocks or blocks[-1][1] != offset:
+                    blocks.append((frame, offset))
+            return blocks, self.index[-1][1] + 1
+        # without an index, walk the block headers, ignoring a partial last block
+        blocks = []
+        frame = 0
+        offset = self.header.size
+        while offset + _BLOCK.size <= end:
+            frames, length, _, _ = _BLOCK.unpack_from(self._mmap, offset)
+            if offset + _BLOCK.size + length > end:
+                break
+            blocks.append((frame, offset))
+            frame += frames
+            offset += _BLOCK.size + length
+        return blocks, frame
+
+    def _decode(self, block):
+        if self._cached_block != block:
+            offset = self.blocks[block][1]
+            frames, length, first_timestamp, shift = _BLOCK.unpack_from(
+                self._mmap, offset
+            )
+            start = offset + _BLOCK.size
+            self._cached_frames = _decode_block(
+                self._mmap[start : start + length],
+                frames,
+                first_timestamp,
+                shift,
+                self.header,
+            )
+            self._cached_block = block
+        return self._cached_frames
+
+    def _locate(self, frame):
+        # the block holding a frame, and the position of the frame in it
+        block = bisect_right(self._block_starts, frame) - 1
+        return block, frame - self._block_starts[block]
+
+    def __len__(self):
+        return self.frame_count
+
+    @property
+    def frames(self):
+        """The frame data as a `memoryview` of bytes, without copying"""
+        if self.header.compressed:
+            raise ValueError("frames is not available for compressed captures")
+        start = self.header.size
+        return memoryview(self._mmap)[
+            start : start + self.frame_count * self.header.frame_size
+        ]
+
+    def _timestamp(self, frame):
+        if self.header.compressed:
+            block, position = self._locate(frame)
+            return int(self._decode(block)[0][position])
+        return _TIMESTAMP.unpack_from(
+            self._mmap, self.header.size + frame * self.header.frame_size
+        )[0]
+
+    def read_frame(self, frame):
+        """The raw x, y, z counts of one frame, as a `tuple`
+
+        :param int frame: The frame number
+        """
+        if not 0 <= frame < self.frame_count:
+            raise IndexError("frame out of range")
+        if self.header.compressed:
+            block, position = self._locate(frame)
+            xyz = self._decode(block)[1]
+            return tuple(int(value) for value in xyz[3 * position : 3 * position + 3])
+        offset = self.header.size + frame * self.header.frame_size
+        if self.header.timestamps:
+            return _TIMESTAMPED_XYZ.unpack_from(self._mmap, offset)[1:]
+        return _XYZ.unpack_from(self._mmap, offset)
+
+    def timestamp(self, frame):
+        """The timestamp of one frame, in nanoseconds. Only available for captures
+        with timestamps.
+
+        :param int frame: The frame number
+        """
+        if not self.header.timestamps:
+            raise ValueError("capture has no timestamps")
+        if not 0 <= frame < self.frame_count:
+            raise IndexError("frame out of range")
+        return self._timestamp(frame)
+
+    def find(self, timestamp):
+        """The number of the first frame at or after ``timestamp``, or
+        :attr:`frame_count` if there is none. Runs in O(log n), touching only a few
+        pages of the file.
+
+        :param int timestamp: A `time.monotonic_ns` timestamp
+        """
+        index = self.index
+        if not index:
+            if not self.header.timestamps:
+                raise ValueError("capture has no time index")
+            low, high = 0, self.frame_count
+        else:
+            i = bisect_left(self._index_times, timestamp)
+            if i == 0:
+                return 0
+            if i == len(index):
+                return self.frame_count
+            start_time, low, _ = index[i - 1]
+            end_time, high, _ = index[i]
+            if not self.header.timestamps:
+                if end_time <= start_time:
+                    return high
+                # frames are evenly spaced between index entries, round up
+                return low + -(
+                    -(timestamp - start_time) * (high - low) // (end_time - start_time)
+                )
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def frame_range(self, start_time, end_time):
+        """The frames recorded from ``start_time`` up to, but excluding,
+        ``end_time``, as a ``(start, stop)`` pair of frame numbers.
+
+        :param int start_time: A `time.monotonic_ns` timestamp
+        :param int end_time: A `time.monotonic_ns` timestamp
+        """
+        start = self.find(start_time)
+        return start, max(start, self.find(end_time))
+
+    def slice(self, start_time, end_time):
+        """The frames recorded from ``start_time`` up to, but excluding,
+        ``end_time``, as a `memoryview` of bytes, without copying.
+
+        :param int start_time: A `time.monotonic_ns` timestamp
+        :param int end_time: A `time.monotonic_ns` timestamp
+        """
+        start, stop = self.frame_range(start_time, end_time)
+        frame_size = self.header.frame_size
+        return self.frames[start * frame_size : stop * frame_size]
+
+    @property
+    def samples(self):
+        """The raw ``x0, y0, z0, x1, ...`` counts as a `memoryview` of ``int16``,
+        without copying. Only available for captures without timestamps, and on
+        little-endian hosts."""
+        if self.header.timestamps:
+            raise ValueError("samples is not available for timestamped captures")
+        return self.frames.cast("h")
+
+    def to_numpy(self, start=0, stop=None):
+        """The frames as a NumPy structured array, without copying unless the
+        capture is compressed. The ``"xyz"`` field is an ``int16`` array of shape
+        ``(N, 3)`` and, for timestamped captures, the ``"timestamp"`` field is an
+        ``int64`` array of shape ``(N,)``.
+
+        :param int start: The first frame to include
+        :param int stop: The frame to stop before, by default the end of the capture
+        """
+        if np is None:
+            raise ImportError("to_numpy requires NumPy")
+        fields = [("xyz", "<i2", (3,))]
+        if self.header.timestamps:
+            fields.insert(0, ("timestamp", "<i8"))
+        stop = self.frame_count if stop is None else min(stop, self.frame_count)
+        start = min(start, stop)
+        dtype = np.dtype(fields)
+        if self.header.compressed:
+            if start == stop:
+                return np.empty(0, dtype=dtype)
+            first = self._locate(start)[0]
+            parts = []
+            for block in range(first, self._locate(stop - 1)[0] + 1):
+                timestamps, xyz = self._decode(block)
+                part = np.empty(len(xyz) // 3, dtype=dtype)
+                part["xyz"] = np.asarray(xyz).reshape(-1, 3)
+                if timestamps is not None:
+                    part["timestamp"] = timestamps
+                parts.append(part)
+            offset = start - self._block_starts[first]
+            return np.concatenate(parts)[offset : offset + stop - start]
+        return np.frombuffer(
+            self._mmap,
+            dtype=dtype,
+            count=stop - start,
+            offset=self.header.size + start * self.header.frame_size,
+        )
+
+    def close(self):
+        """Unmap the file. Views returned by the reader must be released first."""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
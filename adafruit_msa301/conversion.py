@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.conversion`
+================================================================================
+
+Vectorized conversion of raw MSA301/MSA311 samples, for example the blocks returned
+by `adafruit_msa301.MSA301.read_samples`, into physical units with NumPy.
+
+This module is meant for hosts running CPython and requires NumPy. It is not
+imported by `adafruit_msa301` itself, so the driver keeps working without it.
+
+.. code-block:: python
+
+    from adafruit_msa301.conversion import convert_block
+
+    block = msa.read_samples(1000)
+    accel = convert_block(block)  # float32 array of shape (1000, 3) in m/s^2
+
+"""
+
+import numpy as np
+
+from adafruit_msa301 import _SCALE_TABLE, _STANDARD_GRAVITY
+
+# multipliers from the m/s^2 of _SCALE_TABLE
+_UNITS = {"m/s^2": 1.0, "g": 1 / _STANDARD_GRAVITY, "mg": 1000 / _STANDARD_GRAVITY}
+
+
+def convert(
+    raw, accel_range, resolution, *, unit="m/s^2", dtype=np.float32, out=None
+):  # pylint: disable=too-many-arguments
+    """Convert raw, left-justified x, y, z counts into acceleration in one
+    vectorized pass.
+
+    :param raw: The raw counts, an ``int16`` array-like of shape ``(N, 3)`` or a flat
+        ``x0, y0, z0, x1, ...`` sequence such as an ``array('h')``.
+    :param int accel_range: The `adafruit_msa301.Range` the samples were taken with
+    :param int resolution: The `adafruit_msa301.Resolution` the samples were taken with
+    :param str unit: ``"m/s^2"`` (default), ``"g"`` or ``"mg"``
+    :param dtype: The floating point type of the result, ``float32`` by default
+    :param out: An existing float array of shape ``(N, 3)`` to write the result to
+    :return: A float array of shape ``(N, 3)``
+    """
+    if unit not in _UNITS:
+        raise ValueError("unit must be one of %s" % ", ".join(_UNITS))
+    raw = np.asarray(raw, dtype=np.int16).reshape(-1, 3)
+    if out is None:
+        out = np.empty(raw.shape, dtype=dtype)
+    elif out.shape != raw.shape:
+        raise ValueError("out must have shape %r" % (raw.shape,))
+
+    shift, scale = _SCALE_TABLE[resolution << 2 | accel_range]
+    # an arithmetic right shift is a floored division by a power of two, which is
+    # exact in floating point, so the shift can be done in place in ``out``
+    np.multiply(raw, 2.0**-shift, out=out)
+    np.floor(out, out=out)
+    np.multiply(out, scale * _UNITS[unit], out=out)
+    return out
+
+
+def convert_block(block, **kwargs):
+    """Convert a `adafruit_msa301.SampleBlock` using the range and resolution
+    recorded with it. Keyword arguments are passed on to `convert`."""
+    return convert(block.samples, block.range, block.resolution, **kwargs)
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.fleet`
+================================================================================
+
+Synchronized acquisition from many MSA301 and MSA311 sensors spread over one or
+more I2C buses, for hosts running CPython.
+
+Sensors are grouped by the bus they are on. Each cycle, every bus is locked once
+and all of its sensors are read back to back. Different buses are read in parallel
+worker threads, and the results are combined into one time-aligned `FleetFrame`.
+
+.. code-block:: python
+
+    from adafruit_msa301.fleet import SensorFleet
+
+    fleet = SensorFleet([msa301_bus1, msa311_bus1, msa301_bus2])
+    for frame in fleet.stream(100):
+        print(frame.timestamp_ns, frame.samples)
+
+"""
+
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from adafruit_msa301 import _MSA301_REG_OUT_X_L
+
+FleetFrame = namedtuple("FleetFrame", ("timestamp_ns", "samples", "timestamps"))
+"""One acquisition cycle of a `SensorFleet`.
+
+``samples`` holds raw ``x, y, z`` counts for each sensor, in the order the sensors
+were given, as an ``array('h')`` of length ``3 * len(sensors)``. ``timestamps``
+holds the `time.monotonic_ns` time each sensor was read, and ``timestamp_ns`` is
+their midpoint."""
+
+
+class SensorFleet:
+    """Read a set of sensors together, one bus lock per bus per cycle.
+
+    :param sensors: The `adafruit_msa301.MSA301` and `adafruit_msa301.MSA311`
+        instances to read
+    """
+
+    def __init__(self, sensors):
+        self.sensors = tuple(sensors)
+        groups = {}
+        for index, sensor in enumerate(self.sensors):
+            bus = sensor.i2c_device.i2c
+            groups.setdefault(id(bus), (bus, []))[1].append(index)
+        self._groups = tuple((bus, tuple(indices)) for bus, indices in groups.values())
+        self._address = bytes((_MSA301_REG_OUT_X_L,))
+        self._executor = ThreadPoolExecutor(max_workers=len(self._groups))
+
+    @property
+    def bus_count(self):
+        """The number of distinct I2C buses the sensors are on"""
+        return len(self._groups)
+
+    def _read_bus(self, bus, indices, samples, timestamps):
+        raw = memoryview(samples).cast("B")
+        while not bus.try_lock():
+            time.sleep(0)
+        try:
+            for index in indices:
+                # the bus is already locked, so talk to the I2CDevice without entering it
+                self.sensors[index].i2c_device.write_then_readinto(
+                    self._address, raw[6 * index : 6 * index + 6]
+                )
+                timestamps[index] = time.monotonic_ns()
+        finally:
+            bus.unlock()
+
+    def read_frame(self):
+        """Read every sensor once and return a `FleetFrame`"""
+        count = len(self.sensors)
+        samples = array("h", bytes(6 * count))
+        timestamps = array("q", bytes(8 * count))
+        futures = [
+            self._executor.submit(self._read_bus, bus, indices, samples, timestamps)
+            for bus, indices in self._groups
+        ]
+        for future in futures:
+            future.result()
+        midpoint = (min(timestamps) + max(timestamps)) // 2
+        return FleetFrame(midpoint, samples, timestamps)
+
+    def stream(self, rate, count=None):
+        """Yield a `FleetFrame` ``rate`` times per second.
+
+        :param float rate: The number of cycles per second
+        :param int count: Stop after this many frames. By default, run forever.
+        """
+        period_ns = int(1_000_000_000 / rate)
+        deadline = time.monotonic_ns()
+        produced = 0
+        while count is None or produced < count:
+            yield self.read_frame()
+            produced += 1
+            deadline += period_ns
+            delay = deadline - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1_000_000_000)
+            else:
+                deadline = time.monotonic_ns()
+
+    def close(self):
+        """Shut down the bus worker threads"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.instrumentation`
+================================================================================
+
+Opt-in accounting of the I2C traffic of a sensor: reads, writes and bytes per
+register, and a histogram of transaction latencies.
+
+:func:`instrument` replaces the sensor's ``i2c_device`` with a counting wrapper,
+and :func:`uninstrument` puts the original back. Sensors that were never
+instrumented talk to their `adafruit_bus_device.i2c_device.I2CDevice` directly
+and pay nothing.
+
+.. code-block:: python
+
+    from adafruit_msa301.instrumentation import instrument
+
+    stats = instrument(msa)
+    for _ in range(100):
+        msa.acceleration
+    print(stats.stats()["registers"]["OUT_X_L"])
+
+"""
+
+import time
+
+from adafruit_msa301 import (
+    _MSA301_REG_PARTID,
+    _MSA301_REG_OUT_X_L,
+    _MSA301_REG_MOTIONINT,
+    _MSA301_REG_DATAINT,
+    _MSA301_REG_RESRANGE,
+    _MSA301_REG_ODR,
+    _MSA301_REG_POWERMODE,
+    _MSA301_REG_INTSET0,
+    _MSA301_REG_INTSET1,
+    _MSA301_REG_INTMAP0,
+    _MSA301_REG_INTMAP1,
+    _MSA301_REG_INTCONFIG,
+    _MSA301_REG_INTLATCH,
+    _MSA301_REG_FREEFALLDUR,
+    _MSA301_REG_FREEFALLTH,
+    _MSA301_REG_FREEFALLHY,
+    _MSA301_REG_ACTIVEDUR,
+    _MSA301_REG_ACTIVETH,
+    _MSA301_REG_TAPDUR,
+    _MSA301_REG_TAPTH,
+)
+
+REGISTER_NAMES = {
+    _MSA301_REG_PARTID: "PARTID",
+    _MSA301_REG_OUT_X_L: "OUT_X_L",
+    _MSA301_REG_MOTIONINT: "MOTIONINT",
+    _MSA301_REG_DATAINT: "DATAINT",
+    _MSA301_REG_RESRANGE: "RESRANGE",
+    _MSA301_REG_ODR: "ODR",
+    _MSA301_REG_POWERMODE: "POWERMODE",
+    _MSA301_REG_INTSET0: "INTSET0",
+    _MSA301_REG_INTSET1: "INTSET1",
+    _MSA301_REG_INTMAP0: "INTMAP0",
+    _MSA301_REG_INTMAP1: "INTMAP1",
+    _MSA301_REG_INTCONFIG: "INTCONFIG",
+    _MSA301_REG_INTLATCH: "INTLATCH",
+    _MSA301_REG_FREEFALLDUR: "FREEFALLDUR",
+    _MSA301_REG_FREEFALLTH: "FREEFALLTH",
+    _MSA301_REG_FREEFALLHY: "FREEFALLHY",
+    _MSA301_REG_ACTIVEDUR: "ACTIVEDUR",
+    _MSA301_REG_ACTIVETH: "ACTIVETH",
+    _MSA301_REG_TAPDUR: "TAPDUR",
+    _MSA301_REG_TAPTH: "TAPTH",
+}
+"""Names used in :meth:`InstrumentedI2CDevice.stats` for known register addresses.
+Others are reported in hex."""
+
+# upper bounds of the latency histogram buckets, in microseconds
+_BUCKETS_US = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+def _register_name(register):
+    if register is None:
+        return "unknown"
+    return REGISTER_NAMES.get(register, "0x%02X" % register)
+
+
+class _RegisterStats:  # pylint: disable=too-few-public-methods
+    __slots__ = ("reads", "writes", "bytes_read", "bytes_written", "time_ns")
+
+    def __init__(self):
+        self.reads = self.writes = 0
+        self.bytes_read = self.bytes_written = 0
+        self.time_ns = 0
+
+
+class InstrumentedI2CDevice:
+    """A drop-in wrapper for `adafruit_bus_device.i2c_device.I2CDevice` that
+    counts the traffic going through it. Use :func:`instrument` rather than
+    creating one directly.
+
+    Transactions are attributed to the register address written at the start of
+    them, which is how the MSA301 selects registers. A plain read is attributed to
+    the last register addressed.
+
+    :param device: The `adafruit_bus_device.i2c_device.I2CDevice` to wrap
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self.i2c = device.i2c
+        self.device_address = device.device_address
+        self._register = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset all counters and the latency histogram"""
+        self._registers = {}
+        self._histogram = [0] * (len(_BUCKETS_US) + 1)
+        self._transactions = 0
+
+    def _record(self, register, read, written, elapsed_ns):
+        stats = self._registers.get(register)
+        if stats is None:
+            stats = self._registers[register] = _RegisterStats()
+        if read:
+            stats.reads += 1
+            stats.bytes_read += read
+        if written:
+            stats.writes += 1
+            stats.bytes_written += written
+        stats.time_ns += elapsed_ns
+        self._transactions += 1
+
+        elapsed_us = elapsed_ns / 1000
+        bucket = 0
+        while bucket < len(_BUCKETS_US) and elapsed_us > _BUCKETS_US[bucket]:
+            bucket += 1
+        self._histogram[bucket] += 1
+
+    def stats(self):
+        """Return a snapshot of the counters as a `dict`:
+
+        - ``transactions``: the total number of transactions
+        - ``registers``: for each register name, the ``reads``, ``writes``,
+          ``bytes_read``, ``bytes_written`` and total ``time_us`` of its transactions.
+          The register address byte itself is not counted as written data.
+        - ``latency_us``: a histogram of transaction times, keyed by the upper bound
+          of each bucket in microseconds, with ``"inf"`` for the last one
+        """
+        registers = {}
+        for register, stats in self._registers.items():
+            registers[_register_name(register)] = {
+                "reads": stats.reads,
+                "writes": stats.writes,
+                "bytes_read": stats.bytes_read,
+                "bytes_written": stats.bytes_written,
+                "time_us": stats.time_ns / 1000,
+            }
+        bounds = [str(bound) for bound in _BUCKETS_US] + ["inf"]
+        return {
+            "transactions": self._transactions,
+            "registers": registers,
+            "latency_us": dict(zip(bounds, self._histogram)),
+        }
+
+    def readinto(self, buf, *, start=0, end=None):
+        """Read into ``buf``, see `adafruit_bus_device.i2c_device.I2CDevice.readinto`"""
+        if end is None:
+            end = len(buf)
+        begin = time.monotonic_ns()
+        self.device.readinto(buf, start=start, end=end)
+        self._record(self._register, end - start, 0, time.monotonic_ns() - begin)
+
+    def write(self, buf, *, start=0, end=None):
+        """Write ``buf``, see `adafruit_bus_device.i2c_device.I2CDevice.write`"""
+        if end is None:
+            end = len(buf)
+        if end > start:
+            self._register = buf[start]
+        begin = time.monotonic_ns()
+        self.device.write(buf, start=start, end=end)
+        elapsed = time.monotonic_ns() - begin
+        self._record(self._register, 0, max(end - start - 1, 0), elapsed)
+
+    def write_then_readinto(
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):  # pylint: disable=too-many-arguments
+        """Write then read with a repeated start, see
+        `adafruit_bus_device.i2c_device.I2CDevice.write_then_readinto`"""
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        if out_end > out_start:
+            self._register = out_buffer[out_start]
+        begin = time.monotonic_ns()
+        self.device.write_then_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        elapsed = time.monotonic_ns() - begin
+        self._record(
+            self._register, in_end - in_start, max(out_end - out_start - 1, 0), elapsed
+        )
+
+    def __enter__(self):
+        self.device.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self.device.__exit__(exc_type, exc_val, exc_tb)
+
+
+def instrument(sensor):
+    """Start counting the I2C traffic of ``sensor`` and return its
+    `InstrumentedI2CDevice`, which provides ``stats()`` and ``reset_stats()``.
+    Instrumenting a sensor twice returns the existing wrapper."""
+    if not isinstance(sensor.i2c_device, InstrumentedI2CDevice):
+        sensor.i2c_device = InstrumentedI2CDevice(sensor.i2c_device)
+    return sensor.i2c_device
+
+
+def uninstrument(sensor):
+    """Stop counting the I2C traffic of ``sensor``, restoring direct access to its
+    `adafruit_bus_device.i2c_device.I2CDevice`"""
+    if isinstance(sensor.i2c_device, InstrumentedI2CDevice):
+        sensor.i2c_device = sensor.i2c_device.device
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.interrupts`
+================================================================================
+
+Edge waiters for `adafruit_msa301.MSA301.interrupt_pin`, for hosts that can block
+on a file descriptor (Linux, CPython).
+
+Each waiter has a ``wait(timeout)`` method that blocks until an edge arrives and
+returns `True`, or returns `False` on timeout. Any object with such a method can
+be used as the interrupt pin, for example one built on `keypad` or `countio` in
+CircuitPython.
+
+"""
+
+import fcntl
+import os
+import select
+import struct
+
+# struct gpioevent_request from <linux/gpio.h>: lineoffset, handleflags, eventflags,
+# consumer_label[32], fd
+_GPIOEVENT_REQUEST = struct.Struct("<III32si")
+_GPIO_GET_LINEEVENT_IOCTL = 0xC030B404
+_GPIOHANDLE_REQUEST_INPUT = 1 << 0
+_GPIOEVENT_REQUEST_RISING_EDGE = 1 << 0
+_GPIOEVENT_REQUEST_FALLING_EDGE = 1 << 1
+
+_EDGES = {
+    "rising": _GPIOEVENT_REQUEST_RISING_EDGE,
+    "falling": _GPIOEVENT_REQUEST_FALLING_EDGE,
+    "both": _GPIOEVENT_REQUEST_RISING_EDGE | _GPIOEVENT_REQUEST_FALLING_EDGE,
+}
+
+
+class FileDescriptorEdge:
+    """Wait for edges reported as readable data on a file descriptor, such as a Linux
+    GPIO line event fd. All pending data is consumed by each successful wait, so
+    several edges that arrived together count as one.
+
+    :param int file_descriptor: The file descriptor to wait on
+    """
+
+    def __init__(self, file_descriptor):
+        self.file_descriptor = file_descriptor
+
+    def fileno(self):
+        """The file descriptor, so the waiter can be used with `select` directly"""
+        return self.file_descriptor
+
+    def wait(self, timeout=None):
+        """Block until an edge arrives, or ``timeout`` seconds pass.
+
+        :return: `True` if there was an edge, `False` on timeout
+        """
+        readable, _, _ = select.select((self.file_descriptor,), (), (), timeout)
+        if not readable:
+            return False
+        # drain every queued event so the next wait blocks for a new one
+        while True:
+            os.read(self.file_descriptor, 256)
+            readable, _, _ = select.select((self.file_descriptor,), (), (), 0)
+            if not readable:
+                return True
+
+    def close(self):
+        """Close the file descriptor"""
+        os.close(self.file_descriptor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class GPIOChipEdge(FileDescriptorEdge):
+    """Wait for edges on a Linux GPIO line through the GPIO character device.
+
+    :param str chip: The GPIO chip device, like ``"/dev/gpiochip0"``
+    :param int line: The line offset on that chip that INT1 is connected to
+    :param str edge: ``"falling"`` (default, INT1 is active low out of reset),
+        ``"rising"`` for use with `adafruit_msa301.MSA301.int1_active_high`, or
+        ``"both"``
+    """
+
+    def __init__(self, chip, line, *, edge="falling"):
+        if edge not in _EDGES:
+            raise ValueError("edge must be 'rising', 'falling' or 'both'")
+        request = bytearray(
+            _GPIOEVENT_REQUEST.pack(
+                line, _GPIOHANDLE_REQUEST_INPUT, _EDGES[edge], b"adafruit_msa301", 0
+            )
+        )
+        chip_fd = os.open(chip, os.O_RDONLY)
+        try:
+            fcntl.ioctl(chip_fd, _GPIO_GET_LINEEVENT_IOCTL, request)
+        finally:
+            os.close(chip_fd)
+        super().__init__(_GPIOEVENT_REQUEST.unpack(request)[4])
+
+
+class PipeEdge(FileDescriptorEdge):
+    """A stand-in for an interrupt pin, for tests and simulations. Call
+    :meth:`trigger`, from any thread, to simulate an edge."""
+
+    def __init__(self):
+        read_fd, self._write_fd = os.pipe()
+        super().__init__(read_fd)
+
+    def trigger(self):
+        """Simulate an edge on the pin"""
+        os.write(self._write_fd, b"\x01")
+
+    def close(self):
+        """Close both ends of the pipe"""
+        super().close()
+        os.close(self._write_fd)
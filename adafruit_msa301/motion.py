@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.motion`
+================================================================================
+
+Motion-gated sampling: keep the sensor in low power mode while it is still, and
+only sample at a high data rate while it is moving.
+
+The sensor's active (any-motion) interrupt is the trigger, so no samples are read
+while the sensor is idle. Reads resume once motion is detected. Full-rate
+sampling continues until no motion has been seen for ``quiet_timeout`` seconds.
+
+.. code-block:: python
+
+    import array
+    from adafruit_msa301.motion import MotionGatedSampler
+
+    gate = MotionGatedSampler(msa, quiet_timeout=2.0)
+    sample = array.array("f", (0, 0, 0))
+    while True:
+        if gate.poll(sample):
+            print(sample)
+        elif not gate.active:
+            gate.wait()
+
+"""
+
+import time
+
+from adafruit_msa301 import BandWidth, DataRate, Event, LatchMode, Mode
+
+
+class MotionGatedSampler:  # pylint: disable=too-many-instance-attributes
+    """Switch a sensor between an idle low power configuration and a high data rate
+    configuration, based on its active (any-motion) interrupt.
+
+    Creating the sampler enables motion detection and the new data interrupt,
+    latches interrupts, and puts the sensor in its idle configuration.
+
+    :param sensor: The `adafruit_msa301.MSA301` or `adafruit_msa301.MSA311` to read
+    :param int active_rate: The `adafruit_msa301.DataRate` used while moving
+    :param int active_bandwidth: The `adafruit_msa301.BandWidth` used while moving
+    :param int idle_bandwidth: The `adafruit_msa301.BandWidth` used while idle. In
+        low power mode, this sets how often the sensor checks for motion.
+    :param float quiet_timeout: Seconds without motion before going back to idle
+    :param float idle_poll_interval: Seconds :meth:`wait` sleeps between checks for
+        motion when the sensor has no ``interrupt_pin``
+    :param int threshold: The motion threshold, see
+        `adafruit_msa301.MSA301.enable_motion_detection`
+    :param int duration: The motion duration, see
+        `adafruit_msa301.MSA301.enable_motion_detection`
+    """
+
+    def __init__(
+        self,
+        sensor,
+        *,
+        active_rate=DataRate.RATE_500_HZ,
+        active_bandwidth=BandWidth.WIDTH_250_HZ,
+        idle_bandwidth=BandWidth.WIDTH_7_81_HZ,
+        quiet_timeout=2.0,
+        idle_poll_interval=0.1,
+        threshold=20,
+        duration=0,
+    ):  # pylint: disable=too-many-arguments
+        self.sensor = sensor
+        self.active_rate = active_rate
+        self.active_bandwidth = active_bandwidth
+        self.idle_bandwidth = idle_bandwidth
+        self.quiet_timeout = quiet_timeout
+        self.idle_poll_interval = idle_poll_interval
+        self.active = False
+        """`True` while sampling at the active data rate"""
+        self._last_motion_ns = 0
+
+        with sensor.batch():
+            sensor.enable_motion_detection(threshold=threshold, duration=duration)
+            sensor.interrupt_latch = LatchMode.LATCHED
+            sensor.route_interrupts(active=True)
+            sensor._new_data_int_en = True  # pylint: disable=protected-access
+            self._idle()
+
+    def _idle(self):
+        self.active = False
+        self.sensor.configure(power_mode=Mode.LOWPOWER, bandwidth=self.idle_bandwidth)
+
+    def _activate(self):
+        self.active = True
+        self.sensor.configure(
+            power_mode=Mode.NORMAL,
+            data_rate=self.active_rate,
+            bandwidth=self.active_bandwidth,
+        )
+
+    def poll(self, buf):
+        """Check for motion and, while moving, read a new sample into ``buf``.
+
+        Each call reads the interrupt status once, and the output registers only if
+        the sensor is active and has a new sample. New samples alone cost no other
+        transaction. The latch is only cleared, with one more write, when a motion
+        interrupt was latched, which happens at most once per sample while moving.
+        ``buf`` can be any buffer accepted by
+        `adafruit_msa301.MSA301.read_acceleration_into`.
+
+        Only the active and new data events are taken. Other latched events, such
+        as taps, are kept for `adafruit_msa301.MSA301.tapped`,
+        `adafruit_msa301.MSA301.freefall` and `adafruit_msa301.MSA301.events`, and
+        nothing is added to the event queue.
+
+        :return: `True` if a new sample was read into ``buf``
+        """
+        # pylint: disable=protected-access
+        events = self.sensor._take_events(Event.ACTIVE | Event.NEW_DATA)
+        now = time.monotonic_ns()
+        if events & Event.ACTIVE:
+            self._last_motion_ns = now
+            if not self.active:
+                self._activate()
+                return False
+        if not self.active:
+            return False
+        if now - self._last_motion_ns > self.quiet_timeout * 1_000_000_000:
+            self._idle()
+            return False
+        if events & Event.NEW_DATA:
+            self.sensor.read_acceleration_into(buf)
+            return True
+        return False
+
+    def wait(self, timeout=None):
+        """While idle, wait for motion without reading the sensor: block on the
+        sensor's ``interrupt_pin`` if it has one, or sleep ``idle_poll_interval``
+        seconds. Returns immediately while active.
+
+        :param float timeout: The longest to wait on the interrupt pin, in seconds
+        """
+        if self.active:
+            return
+        if self.sensor.interrupt_pin is not None:
+            self.sensor.wait_for_event(timeout)
+        else:
+            time.sleep(self.idle_poll_interval)
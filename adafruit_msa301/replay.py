@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.replay`
+================================================================================
+
+A simulated MSA301/MSA311 that plays back a capture recorded with
+`adafruit_msa301.capture`. Use it with `adafruit_msa301.simulator.FakeI2C` to run
+the driver against field data instead of a live sensor, to reproduce issues, or to
+load test code that consumes samples faster than the 1000 Hz maximum data rate.
+
+.. code-block:: python
+
+    import array
+    import adafruit_msa301
+    from adafruit_msa301.replay import ReplayMSA3x1
+    from adafruit_msa301.simulator import FakeI2C
+
+    device = ReplayMSA3x1("vibration.msa", speed=None)
+    msa = adafruit_msa301.MSA301(FakeI2C(device), config=device.config)
+    sample = array.array("h", (0, 0, 0))
+    while not device.finished:
+        msa.read_acceleration_into(sample)
+
+"""
+
+import time
+
+from adafruit_msa301 import (
+    _MSA301_I2CADDR_DEFAULT,
+    _MSA311_I2CADDR_DEFAULT,
+    _MSA301_REG_OUT_X_L,
+    _MSA301_REG_DATAINT,
+    _MSA301_REG_RESRANGE,
+    _MSA301_REG_ODR,
+    _MSA301_REG_POWERMODE,
+)
+from adafruit_msa301.capture import PART_MSA311, CaptureReader
+from adafruit_msa301.simulator import SimulatedMSA3x1
+
+
+class ReplayMSA3x1(SimulatedMSA3x1):
+    """A simulated sensor whose output registers play back a capture.
+
+    The device starts with the range, resolution, data rate and bandwidth of the
+    capture, and responds at the MSA311 address if the capture was recorded from
+    one. Pass :attr:`config` to the driver so it keeps those settings.
+
+    Playback starts on the first read of the output or data status registers. With
+    a ``speed``, the output registers hold the frame due at the current playback
+    time, following the recorded timestamps if there are any, and the new data
+    flag is raised whenever a new frame comes due. Frames the host is too slow to
+    read are skipped, like on the real sensor. With ``speed=None``, every read of
+    the output registers returns the next frame and new data is always flagged, so
+    playback runs as fast as the host can read.
+
+    `adafruit_msa301.MSA301.read_samples` paces itself at the configured data rate
+    whatever the playback speed, so read faster than real time with
+    `adafruit_msa301.MSA301.read_acceleration_into` or
+    `adafruit_msa301.MSA301.read_new_acceleration_into`. Interrupt events are not
+    recorded in captures; inject them with :meth:`trigger`.
+
+    :param capture: A `adafruit_msa301.capture.CaptureReader`, or the path of a
+        capture file
+    :param float speed: The playback speed, 1.0 (default) for real time, higher to
+        play faster, or `None` to return a new frame on every read
+    :param bool loop: `True` to start over from the first frame at the end of the
+        capture, rather than holding the last frame
+    """
+
+    def __init__(self, capture, *, speed=1.0, loop=False):
+        if not isinstance(capture, CaptureReader):
+            capture = CaptureReader(capture)
+        if not capture.frame_count:
+            raise ValueError("capture has no frames")
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None")
+        self.capture = capture
+        self.speed = speed
+        self.loop = loop
+        self.position = -1
+        """The number of frames loaded into the output registers so far, minus one.
+        Past the first loop this is larger than the number of frames in the
+        capture."""
+        self._start_ns = None
+
+        header = capture.header
+        period = header.sample_period_ns
+        if header.timestamps:
+            self._first_ns = capture.timestamp(0)
+            last_ns = capture.timestamp(capture.frame_count - 1)
+            self._duration_ns = last_ns - self._first_ns + period
+        else:
+            self._first_ns = 0
+            self._duration_ns = capture.frame_count * period
+        if header.part == PART_MSA311:
+            super().__init__(_MSA311_I2CADDR_DEFAULT)
+        else:
+            super().__init__(_MSA301_I2CADDR_DEFAULT)
+
+    @property
+    def config(self):
+        """The settings of the capture, to pass as the ``config`` argument of
+        `adafruit_msa301.MSA301`"""
+        return self.capture.header.config
+
+    @property
+    def finished(self):
+        """`True` once the last frame has been loaded, unless looping"""
+        return not self.loop and self.position >= self.capture.frame_count - 1
+
+    def reset(self):
+        """Restore every register to its power on value, apply the settings of the
+        capture, and :meth:`rewind`"""
+        super().reset()
+        header = self.capture.header
+        registers = self.registers
+        registers[_MSA301_REG_RESRANGE] = header.resolution << 2 | header.range
+        registers[_MSA301_REG_ODR] = (
+            registers[_MSA301_REG_ODR] & 0xF0 | header.data_rate
+        )
+        registers[_MSA301_REG_POWERMODE] = (
+            registers[_MSA301_REG_POWERMODE] & 0xE1 | header.bandwidth << 1
+        )
+        self.rewind()
+
+    def rewind(self):
+        """Restart playback from the first frame on the next read"""
+        self.position = -1
+        self._start_ns = None
+
+    def _due(self):
+        now = time.monotonic_ns()
+        if self._start_ns is None:
+            self._start_ns = now
+        count = self.capture.frame_count
+        laps, elapsed = divmod(
+            int((now - self._start_ns) * self.speed), self._duration_ns
+        )
+        if laps and not self.loop:
+            return count - 1
+        if self.capture.header.timestamps:
+            # the last frame recorded at or before the playback time
+            frame = self.capture.find(self._first_ns + elapsed + 1) - 1
+        else:
+            frame = elapsed // self.capture.header.sample_period_ns
+        return laps * count + min(frame, count - 1)
+
+    def _load(self, position):
+        self.position = position
+        self.set_raw(*self.capture.read_frame(position % self.capture.frame_count))
+
+    def _read_register(self, register):
+        if register in (_MSA301_REG_OUT_X_L, _MSA301_REG_DATAINT):
+            if self.speed is None:
+                if not self.finished:
+                    if register == _MSA301_REG_OUT_X_L:
+                        self._load(self.position + 1)
+                    else:
+                        self.new_data()
+            else:
+                due = self._due()
+                if due > self.position:
+                    self._load(due)
+        return super()._read_register(register)
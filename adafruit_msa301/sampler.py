@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.sampler`
+================================================================================
+
+Background acquisition of MSA301/MSA311 samples on a dedicated thread, for hosts
+running CPython.
+
+The sampler reads raw frames at the sensor's `adafruit_msa301.MSA301.data_rate`
+into a preallocated ring buffer. Consumers drain batches as `memoryview` slices of
+that buffer, so no data is copied. Their processing time no longer affects when
+samples are taken.
+
+.. code-block:: python
+
+    from adafruit_msa301.sampler import BackgroundSampler
+
+    with BackgroundSampler(msa, capacity=4096) as sampler:
+        while True:
+            with sampler.drain() as (frames, timestamps):
+                # frames is x0, y0, z0, x1, ... as raw counts
+                process(frames, timestamps)
+
+"""
+
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+from adafruit_msa301 import _sample_period_ns
+
+
+class BackgroundSampler:  # pylint: disable=too-many-instance-attributes
+    """Read a sensor at its configured data rate on a background thread.
+
+    :param sensor: The `adafruit_msa301.MSA301` or `adafruit_msa301.MSA311` to read.
+        The sampler must be its only user while running.
+    :param int capacity: The number of frames the ring buffer holds
+    """
+
+    def __init__(self, sensor, capacity=1024):
+        self.sensor = sensor
+        self.capacity = capacity
+        self.overruns = 0
+        """The number of samples dropped because the ring buffer was full"""
+        self._frames = array("h", bytes(6 * capacity))
+        self._timestamps = array("q", bytes(8 * capacity))
+        self._frame_bytes = memoryview(self._frames).cast("B")
+        # total frames written and released, the ring index is the count % capacity
+        self._head = 0
+        self._tail = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling on a new thread"""
+        if self._thread is not None:
+            raise RuntimeError("sampler is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the thread to finish. Frames still in the
+        buffer can be drained afterwards."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def available(self):
+        """The number of frames waiting to be drained"""
+        with self._lock:
+            return self._head - self._tail
+
+    def _run(self):
+        period_ns = _sample_period_ns(self.sensor.data_rate)
+        deadline = time.monotonic_ns()
+        while not self._stop.is_set():
+            with self._lock:
+                full = self._head - self._tail >= self.capacity
+                index = self._head % self.capacity
+            if full:
+                # consumers may still hold views of every slot, so drop the sample
+                self.overruns += 1
+            else:
+                self.sensor.read_acceleration_into(
+                    self._frame_bytes[6 * index : 6 * index + 6]
+                )
+                self._timestamps[index] = time.monotonic_ns()
+                with self._lock:
+                    self._head += 1
+                    self._available.notify_all()
+
+            deadline += period_ns
+            delay = deadline - time.monotonic_ns()
+            if delay > 0:
+                self._stop.wait(delay / 1_000_000_000)
+            else:
+                deadline = time.monotonic_ns()
+
+    def acquire(self, max_frames=None, timeout=None):
+        """Return ``(frames, timestamps)`` views of the oldest undrained frames, without
+        copying. ``frames`` holds raw ``x, y, z`` counts and ``timestamps`` holds
+        `time.monotonic_ns` values, one per frame.
+
+        The views stay valid until :meth:`release` is called, and the sampler will not
+        write to them until then. A batch never wraps around the end of the ring buffer,
+        so it can be shorter than the number of frames available.
+
+        :param int max_frames: The maximum number of frames to return
+        :param float timeout: Seconds to wait for at least one frame. `None` returns
+            immediately, possibly with empty views.
+        """
+        with self._lock:
+            if timeout is not None and self._head == self._tail:
+                self._available.wait(timeout)
+            start = self._tail % self.capacity
+            count = min(self._head - self._tail, self.capacity - start)
+        if max_frames is not None:
+            count = min(count, max_frames)
+        return (
+            memoryview(self._frames)[3 * start : 3 * (start + count)],
+            memoryview(self._timestamps)[start : start + count],
+        )
+
+    def release(self, frames):
+        """Give ``frames`` frames returned by :meth:`acquire` back to the sampler"""
+        with self._lock:
+            if frames > self._head - self._tail:
+                raise ValueError("cannot release more frames than were acquired")
+            self._tail += frames
+
+    @contextmanager
+    def drain(self, max_frames=None, timeout=None):
+        """Context manager around :meth:`acquire` and :meth:`release` that releases the
+        batch when the block exits."""
+        frames, timestamps = self.acquire(max_frames, timeout)
+        try:
+            yield frames, timestamps
+        finally:
+            count = len(timestamps)
+            frames.release()
+            timestamps.release()
+            self.release(count)
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_msa301.simulator`
+================================================================================
+
+An in-memory MSA301/MSA311 and a fake I2C bus, for running the driver without
+hardware: benchmarks, continuous integration, and trying out code on a desktop.
+
+`FakeI2C` implements the parts of the `busio.I2C` API that
+`adafruit_bus_device.i2c_device.I2CDevice` uses. It counts every transaction and
+can add a fixed latency per transaction and a per-byte transfer time, so throughput
+numbers resemble a real bus.
+
+.. code-block:: python
+
+    import adafruit_msa301
+    from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+    device = SimulatedMSA3x1()
+    i2c = FakeI2C(device, frequency=400_000)
+    msa = adafruit_msa301.MSA301(i2c)
+
+    device.set_acceleration(0, 0, 1)  # in g
+    print(msa.acceleration)
+
+"""
+
+import threading
+import time
+
+from adafruit_msa301 import (
+    _MSA301_I2CADDR_DEFAULT,
+    _MSA301_REG_PARTID,
+    _MSA301_REG_OUT_X_L,
+    _MSA301_REG_OUT_Z_H,
+    _MSA301_REG_MOTIONINT,
+    _MSA301_REG_DATAINT,
+    _MSA301_REG_RESRANGE,
+    _MSA301_REG_ODR,
+    _MSA301_REG_POWERMODE,
+    _MSA301_REG_INTSET1,
+    _MSA301_REG_INTLATCH,
+    _MSA301_REG_FREEFALLDUR,
+    _MSA301_REG_FREEFALLTH,
+    _MSA301_REG_FREEFALLHY,
+    _MSA301_REG_ACTIVETH,
+    _MSA301_REG_TAPDUR,
+    _MSA301_REG_TAPTH,
+    _SCALE_TABLE,
+    _STANDARD_GRAVITY,
+)
+
+_REGISTER_COUNT = 0x40
+
+# power on values of the registers that are not zero
+_RESET_VALUES = {
+    _MSA301_REG_PARTID: 0x13,
+    _MSA301_REG_ODR: 0x0F,
+    _MSA301_REG_POWERMODE: 0xDE,
+    _MSA301_REG_FREEFALLDUR: 0x09,
+    _MSA301_REG_FREEFALLTH: 0x30,
+    _MSA301_REG_FREEFALLHY: 0x01,
+    _MSA301_REG_ACTIVETH: 0x14,
+    _MSA301_REG_TAPDUR: 0x04,
+    _MSA301_REG_TAPTH: 0x0A,
+}
+
+# registers the host cannot write
+_READ_ONLY = range(_MSA301_REG_PARTID, _MSA301_REG_RESRANGE)
+
+
+class SimulatedMSA3x1:
+    """The register map of one MSA301 or MSA311.
+
+    Registers auto-increment on burst reads and writes, like the real part. The
+    motion and data interrupt status registers are cleared when read unless
+    interrupts are latched in INT_LATCH (0x21). Setting bit 7 of INT_LATCH clears
+    latched interrupts. Reading the output registers clears the new data flag.
+
+    :param int address: The I2C address to respond to. Use 0x62 for an MSA311.
+    """
+
+    def __init__(self, address=_MSA301_I2CADDR_DEFAULT):
+        self.address = address
+        self.registers = bytearray(_REGISTER_COUNT)
+        """The raw register map, which tests can inspect and modify directly"""
+        self._pointer = 0
+        self.reset()
+
+    def reset(self):
+        """Restore every register to its power on value"""
+        self.registers[:] = bytes(_REGISTER_COUNT)
+        for register, value in _RESET_VALUES.items():
+            self.registers[register] = value
+
+    @property
+    def interrupts_latched(self):
+        """`True` if INT_LATCH is set to a latched mode"""
+        return self.registers[_MSA301_REG_INTLATCH] & 0x07 == 0x07
+
+    def set_raw(self, x, y, z):
+        """Set the output registers to raw, left-justified 16 bit counts and flag a
+        new sample"""
+        for offset, value in enumerate((x, y, z)):
+            value &= 0xFFFF
+            self.registers[_MSA301_REG_OUT_X_L + 2 * offset] = value & 0xFF
+            self.registers[_MSA301_REG_OUT_X_L + 2 * offset + 1] = value >> 8
+        self.new_data()
+
+    def set_acceleration(self, x, y, z):
+        """Set the output registers from an acceleration in g, using the current range
+        and resolution, and flag a new sample"""
+        shift, scale = _SCALE_TABLE[self.registers[_MSA301_REG_RESRANGE] & 0x0F]
+        counts_per_g = _STANDARD_GRAVITY / scale
+        limit = (1 << (15 - shift)) - 1
+        self.set_raw(
+            *(
+                max(-limit - 1, min(limit, round(value * counts_per_g))) << shift
+                for value in (x, y, z)
+            )
+        )
+
+    def new_data(self):
+        """Flag a new sample in DATA_INT, if the new data interrupt is enabled"""
+        if self.registers[_MSA301_REG_INTSET1] & 0x10:
+            self.registers[_MSA301_REG_DATAINT] |= 0x01
+
+    def trigger(self, motion_status):
+        """Set bits in the motion interrupt status register (0x09), for example
+        ``1 << 5`` for a single tap"""
+        self.registers[_MSA301_REG_MOTIONINT] |= motion_status
+
+    def write(self, data):
+        """Handle a write transaction: a register address, then data to store"""
+        if not data:
+            return
+        self._pointer = data[0]
+        for value in data[1:]:
+            self._write_register(self._pointer, value)
+            self._pointer += 1
+
+    def read(self, buffer):
+        """Handle a read transaction, continuing from the last register address"""
+        for i, _ in enumerate(buffer):
+            buffer[i] = self._read_register(self._pointer)
+            self._pointer += 1
+
+    def _write_register(self, register, value):
+        if register >= _REGISTER_COUNT or register in _READ_ONLY:
+            return
+        if register == _MSA301_REG_INTLATCH and value & 0x80:
+            self.registers[_MSA301_REG_MOTIONINT] = 0
+            self.registers[_MSA301_REG_DATAINT] = 0
+            value &= 0x7F
+        self.registers[register] = value
+
+    def _read_register(self, register):
+        if register >= _REGISTER_COUNT:
+            return 0
+        value = self.registers[register]
+        if register in (_MSA301_REG_MOTIONINT, _MSA301_REG_DATAINT):
+            if not self.interrupts_latched:
+                self.registers[register] = 0
+        elif register == _MSA301_REG_OUT_Z_H:
+            self.registers[_MSA301_REG_DATAINT] = 0
+        return value
+
+
+class FakeI2C:
+    """A stand-in for `busio.I2C` that talks to simulated devices.
+
+    :param devices: The `SimulatedMSA3x1` devices on the bus
+    :param float latency: Extra seconds spent on every transaction
+    :param int frequency: The bus clock in Hz, used to add 9 clock cycles per byte
+        transferred. By default transfers take no time.
+    """
+
+    def __init__(self, *devices, latency=0.0, frequency=None):
+        self.devices = {device.address: device for device in devices}
+        self.latency = latency
+        self.frequency = frequency
+        self._lock = threading.Lock()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Reset :attr:`transactions`, :attr:`bytes_written` and :attr:`bytes_read`"""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def try_lock(self):
+        """Attempt to lock the bus, like `busio.I2C.try_lock`"""
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        """Unlock the bus"""
+        self._lock.release()
+
+    def scan(self):
+        """The addresses of the simulated devices"""
+        return sorted(self.devices)
+
+    def deinit(self):
+        """Nothing to release, present for API compatibility"""
+
+    def _device(self, address):
+        try:
+            return self.devices[address]
+        except KeyError:
+            raise OSError(19, "No such device") from None
+
+    def _transfer(self, written, read):
+        self.transactions += 1
+        self.bytes_written += written
+        self.bytes_read += read
+        delay = self.latency
+        if self.frequency:
+            delay += 9 * (written + read) / self.frequency
+        if delay:
+            # busy-wait, time.sleep is too coarse for microsecond delays
+            end = time.perf_counter() + delay
+            while time.perf_counter() < end:
+                pass
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Write ``buffer[start:end]`` to the device at ``address``"""
+        data = bytes(memoryview(buffer).cast("B")[start:end])
+        device = self._device(address)
+        self._transfer(len(data), 0)
+        device.write(data)
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Read from the device at ``address`` into ``buffer[start:end]``"""
+        view = memoryview(buffer).cast("B")[start:end]
+        device = self._device(address)
+        self._transfer(0, len(view))
+        device.read(view)
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):  # pylint: disable=too-many-arguments
+        """Write ``buffer_out[out_start:out_end]`` then read into
+        ``buffer_in[in_start:in_end]`` with a repeated start, as one transaction"""
+        data = bytes(memoryview(buffer_out).cast("B")[out_start:out_end])
+        view = memoryview(buffer_in).cast("B")[in_start:in_end]
+        device = self._device(address)
+        self._transfer(len(data), len(view))
+        device.write(data)
+        device.read(view)
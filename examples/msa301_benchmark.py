@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Benchmark the driver's public operations against the simulated sensor and print
+# the I2C transactions, bytes, time and peak heap allocated by the driver per call
+# as JSON.
+# Runs on a desktop with CPython, no hardware needed:
+#
+#   python3 examples/msa301_benchmark.py --frequency 400000 > before.json
+
+import argparse
+import array
+import json
+import platform
+import time
+import tracemalloc
+
+import adafruit_msa301
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+parser = argparse.ArgumentParser(description="MSA301 driver benchmark")
+parser.add_argument("--iterations", type=int, default=1000)
+parser.add_argument("--frequency", type=int, default=None, help="simulated bus Hz")
+parser.add_argument(
+    "--latency", type=float, default=0.0, help="seconds per transaction"
+)
+args = parser.parse_args()
+
+device = SimulatedMSA3x1()
+i2c = FakeI2C(device, latency=args.latency, frequency=args.frequency)
+msa = adafruit_msa301.MSA301(i2c)
+msa.data_rate = adafruit_msa301.DataRate.RATE_1000_HZ
+msa.enable_tap_detection()
+device.set_acceleration(0.1, -0.2, 1.0)
+
+float_sample = array.array("f", (0, 0, 0))
+raw_sample = array.array("h", (0, 0, 0))
+raw_bytes = bytearray(6)
+block = array.array("h", bytes(6 * 10))
+
+
+def set_range():
+    msa.range = adafruit_msa301.Range.RANGE_4_G
+
+
+def set_resolution():
+    msa.resolution = adafruit_msa301.Resolution.RESOLUTION_14_BIT
+
+
+def set_data_rate():
+    msa.data_rate = adafruit_msa301.DataRate.RATE_1000_HZ
+
+
+def set_bandwidth():
+    msa.bandwidth = adafruit_msa301.BandWidth.WIDTH_250_HZ
+
+
+def set_power_mode():
+    msa.power_mode = adafruit_msa301.Mode.NORMAL
+
+
+register = bytearray(1)
+
+
+def raw_register_read():
+    # the cost of the simulated bus and I2CDevice alone, for comparison
+    with msa.i2c_device as bus_device:
+        bus_device.write_then_readinto(register, register)
+
+
+operations = {
+    "baseline: raw 1 byte register read": raw_register_read,
+    "acceleration": lambda: msa.acceleration,
+    "read_acceleration_into(array('f'))": lambda: msa.read_acceleration_into(
+        float_sample
+    ),
+    "read_acceleration_into(array('h'))": lambda: msa.read_acceleration_into(
+        raw_sample
+    ),
+    "read_acceleration_into(bytearray)": lambda: msa.read_acceleration_into(raw_bytes),
+    "read_samples(10)": lambda: msa.read_samples(10, block),
+    "data_ready": lambda: msa.data_ready,
+    "tapped": lambda: msa.tapped,
+    "range": lambda: msa.range,
+    "range =": set_range,
+    "resolution =": set_resolution,
+    "data_rate =": set_data_rate,
+    "bandwidth =": set_bandwidth,
+    "power_mode =": set_power_mode,
+    "enable_tap_detection": msa.enable_tap_detection,
+    "refresh_config": msa.refresh_config,
+}
+
+
+class StaticDevice:
+    # serves a copy of the simulated registers without allocating anything, and
+    # ignores writes, so that only allocations made by the driver raise the
+    # tracemalloc peak
+
+    def __init__(self, registers):
+        self.registers = bytes(registers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def write(self, buf, *, start=0, end=None):
+        pass
+
+    def write_then_readinto(
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):  # pylint: disable=too-many-arguments,unused-argument
+        address = out_buffer[out_start]
+        if in_end is None:
+            in_end = len(in_buffer)
+        i = in_start
+        while i < in_end:
+            in_buffer[i] = self.registers[address]
+            address += 1
+            i += 1
+
+
+def peak_allocation(operation, repeats):
+    # the largest tracemalloc peak of one call, which also counts objects freed
+    # before the call returns. CPython allocates ints above 256, so raw counts and
+    # register values add a few objects that MicroPython does not allocate.
+    bus = msa.i2c_device
+    msa.i2c_device = StaticDevice(device.registers)
+    operation()  # warm up with the stand-in
+    tracemalloc.start()
+    worst = 0
+    for _ in range(repeats):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        operation()
+        worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    msa.i2c_device = bus
+    return worst
+
+
+def measure(operation, iterations):
+    operation()  # warm up caches and lazily created objects
+
+    i2c.reset_counters()
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        operation()
+    elapsed = time.perf_counter_ns() - start
+    transactions = i2c.transactions
+    transferred = i2c.bytes_written + i2c.bytes_read
+
+    allocated = peak_allocation(operation, min(iterations, 100))
+
+    return {
+        "transactions_per_call": transactions / iterations,
+        "bytes_per_call": transferred / iterations,
+        "us_per_call": elapsed / iterations / 1000,
+        "driver_peak_alloc_bytes_per_call": allocated,
+    }
+
+
+results = {
+    "python": platform.python_implementation() + " " + platform.python_version(),
+    "iterations": args.iterations,
+    "bus_frequency": args.frequency,
+    "bus_latency": args.latency,
+    "operations": {
+        name: measure(operation, args.iterations)
+        for name, operation in operations.items()
+    },
+}
+print(json.dumps(results, indent=2))
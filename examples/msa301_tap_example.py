@@ -9,8 +9,10 @@ i2c = board.I2C()  # uses board.SCL and board.SDA
 msa = adafruit_msa301.MSA301(i2c)
 
 msa.enable_tap_detection()
+# hold taps until they are read, so the sensor does not have to be polled constantly
+msa.interrupt_latch = adafruit_msa301.LatchMode.LATCHED
 
 while True:
     if msa.tapped:
         print("Single Tap!")
-    time.sleep(0.01)
+    time.sleep(0.25)
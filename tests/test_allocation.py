@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import array
+import tracemalloc
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import _MSA301_REG_OUT_X_L
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+
+class StaticDevice:
+    """Stands in for an I2CDevice, serving a copy of a register map without
+    allocating anything itself, so that only allocations made by the driver raise
+    the tracemalloc peak"""
+
+    def __init__(self, registers):
+        self.registers = bytes(registers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def write_then_readinto(
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):  # pylint: disable=too-many-arguments,unused-argument
+        register = out_buffer[out_start]
+        if in_end is None:
+            in_end = len(in_buffer)
+        i = in_start
+        while i < in_end:
+            in_buffer[i] = self.registers[register]
+            register += 1
+            i += 1
+
+
+@pytest.fixture(name="msa")
+def fixture_msa():
+    device = SimulatedMSA3x1()
+    # CPython allocates ints above 256, MicroPython does not: keep the counts small
+    # so that only objects created by the driver show up
+    device.set_raw(100, 4, 200)
+    msa = adafruit_msa301.MSA301(FakeI2C(device))
+    msa.i2c_device = StaticDevice(device.registers)
+    return msa
+
+
+def peak_per_call(operation, repeats=100):
+    for _ in range(10):
+        operation()  # warm up caches and lazily created objects
+    tracemalloc.start()
+    try:
+        worst = 0
+        for _ in range(repeats):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            operation()
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return worst
+
+
+def bus_only(msa):
+    register = bytearray((_MSA301_REG_OUT_X_L,))
+    raw = bytearray(6)
+
+    def read():
+        with msa.i2c_device as i2c:
+            i2c.write_then_readinto(register, raw, out_end=1)
+
+    return peak_per_call(read)
+
+
+@pytest.mark.parametrize(
+    "buf",
+    (bytearray(6), array.array("h", (0, 0, 0)), array.array("f", (0, 0, 0))),
+    ids=("bytearray", "array-h", "array-f"),
+)
+def test_read_into_no_allocation(msa, buf):
+    assert peak_per_call(lambda: msa.read_acceleration_into(buf)) <= bus_only(msa)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    (lambda msa: msa.acceleration, lambda msa: msa.read_samples(1)),
+    ids=("acceleration", "read_samples"),
+)
+def test_allocation_is_detected(msa, operation):
+    assert peak_per_call(lambda: operation(msa)) > bus_only(msa)
+
+
+def test_read_into_values(msa):
+    raw = array.array("h", (0, 0, 0))
+    assert msa.read_acceleration_into(raw) is raw
+    assert list(raw) == [100, 4, 200]
+
+    scaled = msa.read_acceleration_into(array.array("f", (0, 0, 0)))
+    assert scaled.tolist() == pytest.approx(msa.acceleration, rel=1e-6)
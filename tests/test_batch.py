@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import (
+    Range,
+    DataRate,
+    _MSA301_REG_ODR,
+    _MSA301_REG_RESRANGE,
+    _MSA301_REG_TAPDUR,
+)
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+
+class FailingMSA3x1(SimulatedMSA3x1):
+    """Raises on writes to ``fail_on`` once it is set"""
+
+    fail_on = None
+
+    def write(self, data):
+        if self.fail_on is not None and data and data[0] == self.fail_on:
+            raise OSError("simulated bus error")
+        super().write(data)
+
+
+@pytest.fixture(name="device")
+def fixture_device():
+    return FailingMSA3x1()
+
+
+@pytest.fixture(name="bus")
+def fixture_bus(device):
+    return FakeI2C(device)
+
+
+@pytest.fixture(name="msa")
+def fixture_msa(bus):
+    return adafruit_msa301.MSA301(bus)
+
+
+def test_batch_writes_once(msa, bus, device):
+    bus.reset_counters()
+    with msa.batch():
+        msa.range = Range.RANGE_8_G
+        msa.data_rate = DataRate.RATE_1000_HZ
+        assert msa.range == Range.RANGE_8_G
+        assert bus.transactions == 0
+    assert bus.transactions == 1
+    assert device.registers[_MSA301_REG_RESRANGE] & 0b11 == Range.RANGE_8_G
+
+
+def test_nested_batch_error(msa, device):
+    with msa.batch():
+        msa.range = Range.RANGE_8_G
+        with pytest.raises(ValueError):
+            with msa.batch():
+                msa.range = Range.RANGE_2_G
+                msa.data_rate = DataRate.RATE_1000_HZ
+                raise ValueError
+        assert msa.range == Range.RANGE_8_G
+        assert msa.data_rate == DataRate.RATE_500_HZ
+    assert device.registers[_MSA301_REG_RESRANGE] & 0b11 == Range.RANGE_8_G
+    assert device.registers[_MSA301_REG_ODR] & 0x0F == DataRate.RATE_500_HZ
+
+
+def test_outer_batch_error(msa, bus):
+    bus.reset_counters()
+    with pytest.raises(ValueError):
+        with msa.batch():
+            msa.range = Range.RANGE_8_G
+            raise ValueError
+    assert msa.range == Range.RANGE_4_G
+    assert bus.transactions == 0
+
+
+def test_failed_flush(msa, device):
+    device.fail_on = _MSA301_REG_TAPDUR
+    with pytest.raises(OSError):
+        with msa.batch():
+            msa.range = Range.RANGE_8_G
+            msa.enable_tap_detection(threshold=7)
+    # RESRANGE was written before the failure, TAPDUR and TAPTH were not
+    assert msa.range == Range.RANGE_8_G
+    assert device.registers[_MSA301_REG_RESRANGE] & 0b11 == Range.RANGE_8_G
+    # pylint: disable=protected-access
+    assert msa._tap_threshold == 0x0A
+    msa.refresh_config()
+    assert msa._tap_threshold == 0x0A
+
+
+def test_tap_detection_batched(msa, bus):
+    bus.reset_counters()
+    msa.enable_tap_detection(tap_count=2)
+    # INTSET0, then TAPDUR and TAPTH in one burst
+    assert bus.transactions == 2
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import DataRate, capture
+from adafruit_msa301.capture import (
+    FLAG_COMPRESSED,
+    FLAG_TIMESTAMPS,
+    PART_MSA301,
+    CaptureHeader,
+    CaptureReader,
+    CaptureWriter,
+)
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+
+def make_header(flags=0):
+    return CaptureHeader(
+        part=PART_MSA301,
+        accel_range=1,
+        resolution=0,
+        data_rate=DataRate.RATE_1000_HZ,
+        bandwidth=9,
+        flags=flags,
+    )
+
+
+@pytest.mark.parametrize("flags", (0, FLAG_COMPRESSED), ids=("raw", "compressed"))
+def test_estimated_times_increase(tmp_path, flags):
+    # blocks written much faster than the 1000 Hz data rate
+    path = str(tmp_path / "fast.msa")
+    block = array("h", range(3 * 700))
+    with CaptureWriter(
+        path, make_header(flags), index_interval=100, block_frames=100
+    ) as writer:
+        for _ in range(10_000 // 700 + 1):
+            writer.write(block)
+
+    with CaptureReader(path) as log:
+        times = [entry[0] for entry in log.index]
+        assert times == sorted(times)
+        assert times[1] - times[0] >= 100 * make_header().sample_period_ns
+        assert log.find(log.index[5][0] + 1) == 501
+        assert log.find(log.index[5][0]) == 500
+
+
+def test_write_oversized_block(tmp_path):
+    device = SimulatedMSA3x1()
+    msa = adafruit_msa301.MSA301(FakeI2C(device))
+    msa.data_rate = DataRate.RATE_1000_HZ
+    device.set_raw(10, -20, 30)
+    out = array("h", bytes(6 * 100))
+    block = msa.read_samples(2, out)
+    assert len(block.samples) == 6
+
+    path = str(tmp_path / "block.msa")
+    with CaptureWriter.for_sensor(path, msa) as writer:
+        writer.write(block)
+    with CaptureReader(path) as log:
+        assert log.frame_count == 2
+        assert log.read_frame(1) == (10, -20, 30)
+
+
+def make_frames(count):
+    # full scale jumps and a run of values with unused low bits, so that blocks
+    # hold multi-byte and negative deltas, and different shifts
+    samples = array("h")
+    for i in range(count):
+        if i % 7 == 3:
+            samples.extend((-32768, 32767, -32768))
+        elif i % 50 < 20:
+            samples.extend((i * 16, -i * 32, 4096 - i * 64))
+        else:
+            samples.extend(((i * 2654435761) % 65536 - 32768, -i, i % 3 - 1))
+    period = make_header().sample_period_ns
+    timestamps = []
+    now = 1 << 40
+    for i in range(count):
+        # early and late frames, and one gap of several minutes
+        now += period + (i % 5 - 2) * period // 3
+        if i == count // 2:
+            now += 300_000_000_000
+        timestamps.append(now)
+    return samples, timestamps
+
+
+def write_compressed(path, samples, timestamps, flags, block_frames=100):
+    with CaptureWriter(path, make_header(flags), block_frames=block_frames) as writer:
+        # uneven writes, so blocks are filled across calls
+        start = 0
+        for count in (1, 60, 33, 150, 1000):
+            writer.write(samples[3 * start : 3 * (start + count)], timestamps[start:])
+            start += count
+
+
+@pytest.mark.parametrize("numpy", (True, False), ids=("numpy", "python"))
+@pytest.mark.parametrize(
+    "flags",
+    (FLAG_COMPRESSED, FLAG_COMPRESSED | FLAG_TIMESTAMPS),
+    ids=("xyz", "timestamps"),
+)
+@pytest.mark.parametrize("count", (7, 250), ids=("partial", "blocks"))
+def test_compressed_round_trip(tmp_path, monkeypatch, numpy, flags, count):
+    if not numpy:
+        monkeypatch.setattr(capture, "np", None)
+    samples, timestamps = make_frames(count)
+    path = str(tmp_path / "compressed.msa")
+    write_compressed(path, samples, timestamps, flags)
+
+    with CaptureReader(path) as log:
+        assert log.frame_count == count
+        assert len(log.blocks) == -(-count // 100)
+        frames = [log.read_frame(i) for i in range(count)]
+        assert frames == [tuple(samples[3 * i : 3 * i + 3]) for i in range(count)]
+        if flags & FLAG_TIMESTAMPS:
+            assert [log.timestamp(i) for i in range(count)] == timestamps
+        if numpy:
+            data = log.to_numpy()
+            assert data["xyz"].ravel().tolist() == samples.tolist()
+            if flags & FLAG_TIMESTAMPS:
+                assert data["timestamp"].tolist() == timestamps
+
+
+@pytest.mark.parametrize(
+    "flags",
+    (FLAG_COMPRESSED, FLAG_COMPRESSED | FLAG_TIMESTAMPS),
+    ids=("xyz", "timestamps"),
+)
+def test_numpy_python_identical(tmp_path, monkeypatch, flags):
+    # the index of captures without timestamps holds estimated times
+    monkeypatch.setattr(capture.time, "monotonic_ns", lambda: 1 << 40)
+    samples, timestamps = make_frames(250)
+    with_numpy = tmp_path / "numpy.msa"
+    write_compressed(str(with_numpy), samples, timestamps, flags)
+    monkeypatch.setattr(capture, "np", None)
+    without_numpy = tmp_path / "python.msa"
+    write_compressed(str(without_numpy), samples, timestamps, flags)
+    assert with_numpy.read_bytes() == without_numpy.read_bytes()
+
+
+@pytest.mark.parametrize("numpy", (True, False), ids=("numpy", "python"))
+def test_corrupt_block(tmp_path, monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(capture, "np", None)
+    samples, timestamps = make_frames(250)
+    path = tmp_path / "corrupt.msa"
+    write_compressed(str(path), samples, timestamps, FLAG_COMPRESSED)
+    data = bytearray(path.read_bytes())
+    # merge the first varint of the first block with the next one
+    # pylint: disable=protected-access
+    payload = make_header().size + capture._BLOCK.size
+    while data[payload] & 0x80:
+        payload += 1
+    data[payload] |= 0x80
+    path.write_bytes(data)
+
+    with CaptureReader(str(path)) as log:
+        assert log.read_frame(100) == tuple(samples[300:303])
+        with pytest.raises(ValueError, match="Corrupt capture block"):
+            log.read_frame(0)
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import (
+    _MSA301_REG_ACTIVETH,
+    _MSA301_REG_FREEFALLTH,
+    _MSA301_REG_INTSET0,
+    Event,
+    LatchMode,
+)
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+
+@pytest.fixture(name="device")
+def fixture_device():
+    return SimulatedMSA3x1()
+
+
+@pytest.fixture(name="msa")
+def fixture_msa(device):
+    msa = adafruit_msa301.MSA301(FakeI2C(device))
+    msa.interrupt_latch = LatchMode.LATCHED
+    return msa
+
+
+def test_tapped_keeps_other_events(msa, device):
+    msa.enable_tap_detection()
+    device.trigger(Event.SINGLE_TAP | Event.DOUBLE_TAP)
+    assert msa.tapped
+    assert not msa.tapped
+    msa.enable_tap_detection(tap_count=2)
+    assert msa.tapped
+    assert not msa.tapped
+
+
+def test_events_after_tapped(msa, device):
+    msa.enable_tap_detection()
+    device.trigger(Event.SINGLE_TAP | Event.ACTIVE)
+    assert msa.tapped
+    assert msa.events() == Event.ACTIVE
+    assert msa.events() == 0
+
+
+def test_tapped_after_events(msa, device):
+    msa.enable_tap_detection()
+    device.trigger(Event.SINGLE_TAP | Event.ACTIVE)
+    assert msa.events() == Event.SINGLE_TAP | Event.ACTIVE
+    assert not msa.tapped
+    assert [record.events for record in msa.drain_events()] == [
+        Event.SINGLE_TAP | Event.ACTIVE
+    ]
+
+
+def test_tap_and_freefall(msa, device):
+    msa.enable_tap_detection()
+    msa.enable_freefall_detection()
+    device.trigger(Event.SINGLE_TAP | Event.FREEFALL)
+    assert msa.tapped
+    assert msa.freefall
+    assert not msa.freefall
+    assert msa.events() == 0
+
+
+def test_disable_freefall(msa, device):
+    msa.enable_freefall_detection()
+    msa.enable_freefall_detection(enabled=False, threshold=100)
+    assert device.registers[_MSA301_REG_FREEFALLTH] == 100
+    device.trigger(Event.FREEFALL)
+    assert not msa.freefall
+    with pytest.raises(ValueError):
+        msa.enable_freefall_detection(enabled=False, threshold=256)
+
+
+def test_disable_motion(msa, device):
+    msa.enable_motion_detection(y=False)
+    assert device.registers[_MSA301_REG_INTSET0] & 0b111 == 0b101
+    msa.enable_motion_detection(enabled=False, threshold=100)
+    assert device.registers[_MSA301_REG_INTSET0] & 0b111 == 0
+    assert device.registers[_MSA301_REG_ACTIVETH] == 100
+    with pytest.raises(ValueError):
+        msa.enable_motion_detection(enabled=False, duration=4)
+
+
+def test_clear_interrupts(msa, device):
+    msa.enable_tap_detection()
+    device.trigger(Event.SINGLE_TAP | Event.DOUBLE_TAP)
+    assert msa.tapped
+    msa.clear_interrupts()
+    msa.enable_tap_detection(tap_count=2)
+    assert not msa.tapped
+
+
+def test_unlatched_tap(msa, device):
+    msa.interrupt_latch = LatchMode.NON_LATCHED
+    msa.enable_tap_detection(tap_count=2)
+    device.trigger(Event.SINGLE_TAP)
+    assert not msa.tapped
+    device.trigger(Event.DOUBLE_TAP)
+    assert msa.tapped
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import array
+
+import adafruit_msa301
+from adafruit_msa301 import Event
+from adafruit_msa301.motion import MotionGatedSampler
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+
+def test_poll_transactions():
+    device = SimulatedMSA3x1()
+    bus = FakeI2C(device)
+    gate = MotionGatedSampler(adafruit_msa301.MSA301(bus))
+    sample = array.array("h", (0, 0, 0))
+
+    bus.reset_counters()
+    assert not gate.poll(sample)
+    assert bus.transactions == 1
+
+    device.trigger(Event.ACTIVE)
+    assert not gate.poll(sample)
+    assert gate.active
+
+    # a new sample without motion: the status read and the output read
+    device.set_raw(1, 2, 3)
+    bus.reset_counters()
+    assert gate.poll(sample)
+    assert list(sample) == [1, 2, 3]
+    assert bus.transactions == 2
+
+    # with motion latched too, one more write clears the latch
+    device.set_raw(4, 5, 6)
+    device.trigger(Event.ACTIVE)
+    bus.reset_counters()
+    assert gate.poll(sample)
+    assert bus.transactions == 3
+
+
+def test_tap_survives_polling():
+    device = SimulatedMSA3x1()
+    msa = adafruit_msa301.MSA301(FakeI2C(device))
+    msa.enable_tap_detection()
+    gate = MotionGatedSampler(msa)
+    sample = array.array("h", (0, 0, 0))
+
+    device.trigger(Event.ACTIVE)
+    gate.poll(sample)
+    device.trigger(Event.SINGLE_TAP)
+    for i in range(200):
+        device.set_raw(i, i, i)
+        assert gate.poll(sample)
+    assert msa.events_dropped == 0
+    assert not msa.drain_events()
+    assert msa.tapped
+    assert not msa.tapped
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import DataRate, Range, Resolution, replay
+from adafruit_msa301.capture import (
+    FLAG_TIMESTAMPS,
+    PART_MSA301,
+    CaptureHeader,
+    CaptureWriter,
+)
+from adafruit_msa301.replay import ReplayMSA3x1
+from adafruit_msa301.simulator import FakeI2C
+
+FRAMES = [(16, -32, 48), (-16, 0, 1600), (32752, -32768, 0), (0, 16, -16)]
+MS = 1_000_000
+
+
+def write_capture(path, flags=0, timestamps=None):
+    header = CaptureHeader(
+        part=PART_MSA301,
+        accel_range=Range.RANGE_4_G,
+        resolution=Resolution.RESOLUTION_12_BIT,
+        data_rate=DataRate.RATE_1000_HZ,
+        bandwidth=9,
+        flags=flags,
+    )
+    with CaptureWriter(path, header) as writer:
+        writer.write(
+            array("h", [value for frame in FRAMES for value in frame]), timestamps
+        )
+    return path
+
+
+def open_replay(path, **kwargs):
+    device = ReplayMSA3x1(path, **kwargs)
+    msa = adafruit_msa301.MSA301(FakeI2C(device), config=device.config)
+    return device, msa
+
+
+def read(msa):
+    return tuple(msa.read_acceleration_into(array("h", (0, 0, 0))))
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    now = [0]
+    monkeypatch.setattr(replay.time, "monotonic_ns", lambda: now[0])
+    return now
+
+
+def test_unpaced_frames(tmp_path):
+    device, msa = open_replay(write_capture(str(tmp_path / "c.msa")), speed=None)
+    assert msa.range == Range.RANGE_4_G
+    assert msa.resolution == Resolution.RESOLUTION_12_BIT
+    frames = []
+    while not device.finished:
+        frames.append(read(msa))
+    assert frames == FRAMES
+    # the last frame is held
+    assert read(msa) == FRAMES[-1]
+    assert device.position == len(FRAMES) - 1
+
+
+def test_unpaced_loop(tmp_path):
+    device, msa = open_replay(
+        write_capture(str(tmp_path / "c.msa")), speed=None, loop=True
+    )
+    frames = [read(msa) for _ in range(2 * len(FRAMES) + 1)]
+    assert frames == FRAMES + FRAMES + FRAMES[:1]
+    assert not device.finished
+    assert device.position == 2 * len(FRAMES)
+    device.rewind()
+    assert read(msa) == FRAMES[0]
+
+
+def test_paced_timestamps(tmp_path, clock):
+    # frames at 0, 1, 5 and 6 ms, played at twice the recorded speed
+    start = 1 << 40
+    times = [start, start + MS, start + 5 * MS, start + 6 * MS]
+    path = write_capture(str(tmp_path / "c.msa"), FLAG_TIMESTAMPS, times)
+    device, msa = open_replay(path, speed=2.0)
+    expected = {
+        0: 0,
+        MS // 2: 1,
+        MS: 1,  # in the recorded gap
+        5 * MS // 2: 2,
+        3 * MS: 3,
+        10 * MS: 3,  # past the end, the last frame is held
+    }
+    for now, frame in expected.items():
+        clock[0] = now
+        assert read(msa) == FRAMES[frame], now
+    assert device.finished
+
+
+def test_paced_loop(tmp_path, clock):
+    # 4 frames 1 ms apart, without timestamps
+    device, msa = open_replay(write_capture(str(tmp_path / "c.msa")), loop=True)
+    assert read(msa) == FRAMES[0]
+    clock[0] = 2 * MS
+    assert read(msa) == FRAMES[2]
+    clock[0] = 5 * MS
+    assert read(msa) == FRAMES[1]
+    assert device.position == len(FRAMES) + 1
+    assert not device.finished
+
+
+def test_invalid_speed(tmp_path):
+    with pytest.raises(ValueError):
+        ReplayMSA3x1(write_capture(str(tmp_path / "c.msa")), speed=0)
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_msa301
+from adafruit_msa301 import Range, Resolution
+from adafruit_msa301.capture import PART_MSA301, CaptureHeader
+from adafruit_msa301.simulator import FakeI2C, SimulatedMSA3x1
+
+G = 9.806
+
+# the largest count and the counts per full scale at each resolution
+COUNTS = {
+    Resolution.RESOLUTION_14_BIT: (8191, 8192),
+    Resolution.RESOLUTION_12_BIT: (2047, 2048),
+    Resolution.RESOLUTION_10_BIT: (511, 512),
+    Resolution.RESOLUTION_8_BIT: (127, 128),
+}
+UNUSED_BITS = {
+    Resolution.RESOLUTION_14_BIT: 2,
+    Resolution.RESOLUTION_12_BIT: 4,
+    Resolution.RESOLUTION_10_BIT: 6,
+    Resolution.RESOLUTION_8_BIT: 8,
+}
+FULL_SCALE_G = {
+    Range.RANGE_2_G: 2,
+    Range.RANGE_4_G: 4,
+    Range.RANGE_8_G: 8,
+    Range.RANGE_16_G: 16,
+}
+PAIRS = [(r, res) for r in FULL_SCALE_G for res in COUNTS]
+
+
+@pytest.fixture(name="device")
+def fixture_device():
+    return SimulatedMSA3x1()
+
+
+@pytest.fixture(name="msa")
+def fixture_msa(device):
+    return adafruit_msa301.MSA301(FakeI2C(device))
+
+
+@pytest.mark.parametrize("accel_range,resolution", PAIRS)
+def test_acceleration_scale(msa, device, accel_range, resolution):
+    msa.range = accel_range
+    msa.resolution = resolution
+    largest, full_scale = COUNTS[resolution]
+    g_per_count = FULL_SCALE_G[accel_range] / full_scale
+    # half scale, negative full scale, and the largest count with the unused low
+    # bits set, which must be dropped
+    device.set_raw(0x4000, -0x8000, 0x7FFF)
+    assert msa.acceleration == pytest.approx(
+        (
+            full_scale // 2 * g_per_count * G,
+            -full_scale * g_per_count * G,
+            largest * g_per_count * G,
+        )
+    )
+
+
+@pytest.mark.parametrize("accel_range,resolution", PAIRS)
+def test_simulated_acceleration(msa, device, accel_range, resolution):
+    msa.range = accel_range
+    msa.resolution = resolution
+    largest, full_scale = COUNTS[resolution]
+    g_per_count = FULL_SCALE_G[accel_range] / full_scale
+    # the last axis is clamped to the largest count
+    device.set_acceleration(g_per_count, -3 * g_per_count, 1000)
+    shift = UNUSED_BITS[resolution]
+    assert msa.read_acceleration_into(bytearray(6)) == bytearray(
+        (1 << shift).to_bytes(2, "little", signed=True)
+        + (-3 << shift).to_bytes(2, "little", signed=True)
+        + (largest << shift).to_bytes(2, "little", signed=True)
+    )
+
+
+@pytest.mark.parametrize("accel_range,resolution", PAIRS)
+def test_convert_matches_driver(msa, device, accel_range, resolution):
+    conversion = pytest.importorskip("adafruit_msa301.conversion")
+    msa.range = accel_range
+    msa.resolution = resolution
+    device.set_raw(0x4000, -0x8000, 0x7FFF)
+    block = msa.read_samples(1)
+    assert conversion.convert_block(block).ravel().tolist() == pytest.approx(
+        msa.acceleration, rel=1e-6
+    )
+    assert conversion.convert_block(block, unit="g").ravel().tolist() == (
+        pytest.approx([value / G for value in msa.acceleration], rel=1e-6)
+    )
+
+
+@pytest.mark.parametrize("resolution", COUNTS)
+def test_capture_shift(resolution):
+    header = CaptureHeader(
+        part=PART_MSA301, accel_range=0, resolution=resolution, data_rate=0, bandwidth=0
+    )
+    assert header.shift == UNUSED_BITS[resolution]